@@ -0,0 +1,24 @@
+import argparse
+import time
+
+from core.atlas import ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH, ATLAS_WIDTH, SHADOW_PATH, build_atlas
+from core.catalog import get_catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pack every card face and the card shadow into one atlas sheet.")
+    parser.add_argument("--image", default=ATLAS_IMAGE_PATH)
+    parser.add_argument("--index", default=ATLAS_INDEX_PATH)
+    parser.add_argument("--width", type=int, default=ATLAS_WIDTH, help="maximum sheet width in pixels")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = build_atlas(get_catalog().image_paths, SHADOW_PATH, args.image, args.index, args.width)
+    elapsed = time.perf_counter() - start
+
+    width, height = index.size
+    print(f"Packed {len(index.cards)} cards + shadow into {width}x{height} in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import json
+import os
+import struct
+import zlib
+from typing import NamedTuple
+
+
+ATLAS_IMAGE_PATH = "assets/cards_atlas.png"
+ATLAS_INDEX_PATH = "assets/cards_atlas.json"
+SHADOW_PATH = "assets/cards/card_shadow.png"
+
+ATLAS_WIDTH = 1024
+ATLAS_PADDING = 2   # transparent gutter so filtering never bleeds a neighbour into a card edge
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+Region = tuple[int, int, int, int]   # x, y, w, h
+
+
+class AtlasIndex(NamedTuple):
+    image: str
+    size: tuple[int, int]
+    cards: list[Region]     # indexed by card ID
+    shadow: Region
+
+
+def pack_rects(sizes: list[tuple[int, int]], max_width: int, padding: int = ATLAS_PADDING) -> tuple[int, int, list[Region]]:
+    """
+    Shelf-pack rectangles, tallest first, into rows no wider than max_width.
+    Returns the sheet width, height and one region per input size, in input order.
+    """
+    regions: list[Region | None] = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+
+    x = y = shelf_height = sheet_width = 0
+    for i in order:
+        w, h = sizes[i]
+        if w + 2 * padding > max_width:
+            raise ValueError(f"Image {i} ({w}x{h}) does not fit in a {max_width}px wide atlas")
+
+        if x + w + 2 * padding > max_width:
+            y += shelf_height
+            x = shelf_height = 0
+
+        regions[i] = (x + padding, y + padding, w, h)
+        x += w + 2 * padding
+        shelf_height = max(shelf_height, h + 2 * padding)
+        sheet_width = max(sheet_width, x)
+
+    return sheet_width, y + shelf_height, regions
+
+
+def build_atlas(
+    image_paths: list[str],
+    shadow_path: str = SHADOW_PATH,
+    image_out: str = ATLAS_IMAGE_PATH,
+    index_out: str = ATLAS_INDEX_PATH,
+    max_width: int = ATLAS_WIDTH
+) -> AtlasIndex:
+    images = [read_png(_resolve_path(path)) for path in image_paths + [shadow_path]]
+    width, height, regions = pack_rects([(w, h) for w, h, _ in images], max_width)
+
+    sheet = bytearray(width * height * 4)
+    for (w, h, pixels), (x, y, _, _) in zip(images, regions):
+        row_bytes = w * 4
+        for row in range(h):
+            dst = ((y + row) * width + x) * 4
+            sheet[dst:dst + row_bytes] = pixels[row * row_bytes:(row + 1) * row_bytes]
+
+    write_png(image_out, width, height, sheet)
+
+    index = AtlasIndex(image_out, (width, height), regions[:-1], regions[-1])
+    with open(index_out, "w") as f:
+        json.dump(index._asdict(), f, indent=4)
+    return index
+
+
+def load_atlas_index(path: str = ATLAS_INDEX_PATH) -> AtlasIndex:
+    with open(path) as f:
+        data = json.load(f)
+
+    return AtlasIndex(
+        image=data["image"],
+        size=tuple(data["size"]),
+        cards=[tuple(region) for region in data["cards"]],
+        shadow=tuple(data["shadow"])
+    )
+
+
+def read_png(path: str) -> tuple[int, int, bytearray]:
+    """Decode an 8-bit, non-interlaced RGB or RGBA PNG into (width, height, RGBA bytes)."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError(f"{path} is not a PNG file")
+
+    pos = len(PNG_SIGNATURE)
+    idat = bytearray()
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+
+        if kind == b"IHDR":
+            width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", body)
+        elif kind == b"IDAT":
+            idat += body
+        elif kind == b"IEND":
+            break
+
+    if depth != 8 or color_type not in (2, 6) or interlace:
+        raise ValueError(f"{path}: only 8-bit non-interlaced RGB/RGBA PNGs are supported")
+
+    bpp = 4 if color_type == 6 else 3
+    stride = width * bpp
+    raw = zlib.decompress(bytes(idat))
+
+    pixels = bytearray()
+    prev = bytearray(stride)
+    for row in range(height):
+        start = row * (stride + 1)
+        line = bytearray(raw[start + 1:start + 1 + stride])
+        _unfilter(raw[start], line, prev, bpp)
+        pixels += line
+        prev = line
+
+    if bpp == 3:
+        rgba = bytearray(width * height * 4)
+        rgba[0::4], rgba[1::4], rgba[2::4] = pixels[0::3], pixels[1::3], pixels[2::3]
+        rgba[3::4] = b"\xff" * (width * height)
+        pixels = rgba
+
+    return width, height, pixels
+
+
+def write_png(path: str, width: int, height: int, rgba: bytes) -> None:
+    stride = width * 4
+    raw = b"".join(b"\x00" + rgba[row * stride:(row + 1) * stride] for row in range(height))
+
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+    with open(path, "wb") as f:
+        f.write(PNG_SIGNATURE)
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw, 9)))
+        f.write(chunk(b"IEND", b""))
+
+
+def _unfilter(kind: int, line: bytearray, prev: bytearray, bpp: int) -> None:
+    if kind == 0:
+        return
+    if kind == 1:
+        for i in range(bpp, len(line)):
+            line[i] = (line[i] + line[i - bpp]) & 0xFF
+    elif kind == 2:
+        for i in range(len(line)):
+            line[i] = (line[i] + prev[i]) & 0xFF
+    elif kind == 3:
+        for i in range(len(line)):
+            left = line[i - bpp] if i >= bpp else 0
+            line[i] = (line[i] + ((left + prev[i]) >> 1)) & 0xFF
+    elif kind == 4:
+        for i in range(len(line)):
+            a = line[i - bpp] if i >= bpp else 0
+            b = prev[i]
+            c = prev[i - bpp] if i >= bpp else 0
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            if pa <= pb and pa <= pc:
+                predictor = a
+            elif pb <= pc:
+                predictor = b
+            else:
+                predictor = c
+            line[i] = (line[i] + predictor) & 0xFF
+    else:
+        raise ValueError(f"Unknown PNG filter type {kind}")
+
+
+def _resolve_path(path: str) -> str:
+    # cards.json was authored on a case-insensitive filesystem; match file names loosely
+    if os.path.exists(path):
+        return path
+
+    folder, name = os.path.split(path)
+    for candidate in os.listdir(folder or "."):
+        if candidate.lower() == name.lower():
+            return os.path.join(folder, candidate)
+
+    raise FileNotFoundError(path)
@@ -0,0 +1,226 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from core.catalog import FusionRecipes, NO_FUSION, get_catalog, pair_indices
+from core.engine import get_rules, COPIES_PER_CARD, FUSE_CHANCE, HAND_SIZE, MAX_REFILL, STARTING_HEALTH
+from core.enums import MatchOutcome
+
+
+# Sentinel card ID for empty hand slots; indexes the spare last row/col of every table.
+NO_CARD = -1
+
+CHUNK_SIZE = 1 << 18
+
+_PAIR_LHS, _PAIR_RHS = pair_indices(HAND_SIZE)
+
+
+class BatchResult(NamedTuple):
+    outcome: np.ndarray         # MatchOutcome values per match
+    rounds: np.ndarray
+    player_health: np.ndarray
+    bot_health: np.ndarray
+
+
+class _Tables(NamedTuple):
+    base_deck: np.ndarray
+    attack: np.ndarray
+    defense: np.ndarray
+    recipes: FusionRecipes      # its fusion matrix keeps a spare last row/col that NO_CARD indexes
+    recipe_lhs: np.ndarray
+    recipe_rhs: np.ndarray
+    recipe_out: np.ndarray
+
+
+def _build_tables() -> _Tables:
+    base_cards, fusions = get_rules()
+    cards = base_cards + list(fusions.values())
+    size = max(card.ID for card in cards) + 1
+
+    # One spare slot at the end so NO_CARD (-1) indexes a zero-stat, never-fusing card.
+    attack = np.zeros(size + 1, dtype=np.int32)
+    defense = np.zeros(size + 1, dtype=np.int32)
+    for card in cards:
+        attack[card.ID] = card.attack
+        defense[card.ID] = card.defense
+
+    combos = list(fusions)
+    return _Tables(
+        base_deck=np.array([card.ID for card in base_cards] * COPIES_PER_CARD, dtype=np.int16),
+        attack=attack,
+        defense=defense,
+        recipes=get_catalog().recipes,
+        recipe_lhs=np.array([lhs for lhs, _ in combos], dtype=np.intp),
+        recipe_rhs=np.array([rhs for _, rhs in combos], dtype=np.intp),
+        recipe_out=np.array([fusions[combo].ID for combo in combos], dtype=np.int16),
+    )
+
+
+def simulate(count: int, seed: int | None = None, chunk_size: int = CHUNK_SIZE) -> BatchResult:
+    tables = _build_tables()
+    rng = np.random.default_rng(seed)
+
+    chunks = [
+        _simulate_chunk(min(chunk_size, count - start), tables, rng)
+        for start in range(0, count, chunk_size)
+    ]
+    return BatchResult(*(np.concatenate(column) for column in zip(*chunks)))
+
+
+class _Matches:
+    """Per-match state arrays, one row per match that is still being played."""
+
+    FIELDS = (
+        "index", "player_deck", "player_len", "bot_deck", "bot_len", "bot_counts",
+        "hand", "hand_len", "player_health", "bot_health", "rounds",
+    )
+
+    def __init__(self, n: int, t: _Tables, rng: np.random.Generator):
+        deck_size = len(t.base_deck)
+        card_ids = len(t.attack) - 1
+        dealt = min(HAND_SIZE, deck_size)
+
+        # Both sides' decks in a single shuffle; the top of a deck is the card at index len - 1.
+        decks = rng.permuted(np.tile(t.base_deck, (2 * n, 1)), axis=1)
+
+        self.index = np.arange(n)
+        self.player_deck = decks[:n]
+        self.player_len = np.full(n, deck_size - dealt)
+        self.bot_deck = decks[n:]
+        self.bot_len = np.full(n, deck_size)
+
+        # The bot fuses out of the middle of its deck, so it also tracks per-ID counts for the recipe check.
+        self.bot_counts = np.tile(np.bincount(t.base_deck, minlength=card_ids).astype(np.int16), (n, 1))
+
+        # Hands stay packed to the left in draw order, with two spare NO_CARD columns for shifting.
+        self.hand = np.full((n, HAND_SIZE + 2), NO_CARD, dtype=np.int16)
+        self.hand[:, :dealt] = self.player_deck[:, ::-1][:, :dealt]
+        self.hand_len = np.full(n, dealt)
+
+        self.player_health = np.full(n, STARTING_HEALTH, dtype=np.int32)
+        self.bot_health = np.full(n, STARTING_HEALTH, dtype=np.int32)
+        self.rounds = np.zeros(n, dtype=np.int16)
+
+    def select(self, rows: np.ndarray) -> None:
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name)[rows])
+
+
+def _simulate_chunk(n: int, t: _Tables, rng: np.random.Generator) -> BatchResult:
+    m = _Matches(n, t, rng)
+
+    outcome = np.full(n, MatchOutcome.ONGOING, dtype=np.int8)
+    rounds = np.zeros(n, dtype=np.int16)
+    player_health = np.zeros(n, dtype=np.int32)
+    bot_health = np.zeros(n, dtype=np.int32)
+
+    slots = np.arange(HAND_SIZE)
+    while len(m.index):
+        live = len(m.index)
+        rows = np.arange(live)
+        hand = m.hand
+
+        # Player: coin flip for the first fusable pair in hand order, otherwise a random hand card
+        solo = (rng.random(live) * m.hand_len).astype(np.intp)
+        player_card = hand[rows, solo]
+
+        # Played slots, low then high; the high slot points past the hand when only one card is used
+        used_lo = solo
+        used_hi = np.full(live, HAND_SIZE + 1)
+        used = np.ones(live, dtype=np.intp)
+
+        flipped = np.flatnonzero((m.hand_len >= 2) & (rng.random(live) < FUSE_CHANCE))
+        flipped_hand = hand[flipped]
+        pair_fusion = t.recipes.hand_pairs(flipped_hand[:, :HAND_SIZE])
+        pair_ok = pair_fusion != NO_FUSION
+        fused = pair_ok.any(axis=1)
+        first_pair = pair_ok.argmax(axis=1)[fused]
+        fuse_rows = flipped[fused]
+        player_card[fuse_rows] = pair_fusion[fused, first_pair]
+        used_lo[fuse_rows] = _PAIR_LHS[first_pair]
+        used_hi[fuse_rows] = _PAIR_RHS[first_pair]
+        used[fuse_rows] = 2
+
+        # Bot: coin flip for a random available recipe in its deck, otherwise the top card
+        bot_plays = m.bot_len > 0
+        bot_fuse = np.zeros(live, dtype=bool)
+        bot_card = np.full(live, NO_CARD, dtype=np.int16)
+
+        flipped = np.flatnonzero((m.bot_len >= 2) & (rng.random(live) < FUSE_CHANCE))
+        counts = m.bot_counts[flipped]
+        available = (
+            (counts[:, t.recipe_lhs] > 0)
+            & (counts[:, t.recipe_rhs] > (t.recipe_lhs == t.recipe_rhs))
+        )
+        n_available = available.sum(axis=1)
+        pick = (rng.random(len(flipped)) * n_available).astype(np.intp)
+        recipe = (available.cumsum(axis=1) > pick[:, None]).argmax(axis=1)[n_available > 0]
+        fused_rows = flipped[n_available > 0]
+        if fused_rows.size:
+            bot_fuse[fused_rows] = True
+            bot_card[fused_rows] = t.recipe_out[recipe]
+            for ingredients in (t.recipe_lhs, t.recipe_rhs):
+                _remove_random_copy(m.bot_deck, m.bot_len, m.bot_counts, fused_rows, ingredients[recipe], rng)
+
+        popped_rows = np.flatnonzero(bot_plays & ~bot_fuse)
+        if popped_rows.size:
+            top = m.bot_deck[popped_rows, m.bot_len[popped_rows] - 1]
+            bot_card[popped_rows] = top
+            m.bot_counts[popped_rows, top] -= 1
+            m.bot_len[popped_rows] -= 1
+
+        # Attacks only land when the bot actually had a card to play
+        m.bot_health -= np.where(bot_plays, np.maximum(0, t.attack[player_card] - t.defense[bot_card]), 0)
+        m.player_health -= np.where(bot_plays, np.maximum(0, t.attack[bot_card] - t.defense[player_card]), 0)
+
+        # Drop played cards by shifting the rest left over them, then refill from the top of the deck
+        source = slots + (slots >= used_lo[:, None])
+        source += source >= used_hi[:, None]
+        m.hand[:, :HAND_SIZE] = np.take_along_axis(hand, source, axis=1)
+        m.hand_len -= used
+
+        for draw in range(MAX_REFILL):
+            draw_rows = np.flatnonzero((used > draw) & (m.player_len > 0))
+            m.hand[draw_rows, m.hand_len[draw_rows]] = m.player_deck[draw_rows, m.player_len[draw_rows] - 1]
+            m.player_len[draw_rows] -= 1
+            m.hand_len[draw_rows] += 1
+
+        m.rounds += 1
+
+        player_dead = m.player_health <= 0
+        bot_dead = m.bot_health <= 0
+        result = np.full(live, MatchOutcome.ONGOING, dtype=np.int8)
+        result[(m.player_len + m.hand_len == 0) | (m.bot_len == 0)] = MatchOutcome.STALE
+        result[bot_dead] = MatchOutcome.WIN
+        result[player_dead] = MatchOutcome.LOSE
+        result[player_dead & bot_dead] = MatchOutcome.STALE
+
+        done = result != MatchOutcome.ONGOING
+        if done.any():
+            finished = m.index[done]
+            outcome[finished] = result[done]
+            rounds[finished] = m.rounds[done]
+            player_health[finished] = m.player_health[done]
+            bot_health[finished] = m.bot_health[done]
+            m.select(np.flatnonzero(~done))
+
+    return BatchResult(outcome, rounds, player_health, bot_health)
+
+
+def _remove_random_copy(
+    deck: np.ndarray,
+    deck_len: np.ndarray,
+    counts: np.ndarray,
+    rows: np.ndarray,
+    card_ids: np.ndarray,
+    rng: np.random.Generator
+) -> None:
+    # Removing a random copy and moving the top card into its place keeps the rest uniformly shuffled.
+    in_deck = np.arange(deck.shape[1]) < deck_len[rows, None]
+    matches = (deck[rows] == card_ids[:, None]) & in_deck
+    position = (rng.random(matches.shape, dtype=np.float32) * matches).argmax(axis=1)
+
+    top = deck_len[rows] - 1
+    deck[rows, position] = deck[rows, top]
+    deck_len[rows] = top
+    counts[rows, card_ids] -= 1
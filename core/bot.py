@@ -1,14 +1,19 @@
+from random import Random
 import pykraken as kn
-from random import random, shuffle
 from core.card import Card
 from core.constants import CARD_SIZE, SCN_SIZE
-from core.deck import load_deck, get_card_texture, check_fusion
+from core.deck import load_deck, draw_card
+from core.engine import STARTING_HEALTH
+from core.render_queue import LAYER_PLAYED
 
 
 class Bot:
     def __init__(self):
-        self.health = 50
-        self.deck = load_deck()
+        self.reset()
+
+    def reset(self, rng: Random | None = None) -> None:
+        self.health = STARTING_HEALTH
+        self.deck = load_deck(rng)
         self.hand: list[Card] = []
         self.played_card: Card | None = None
 
@@ -16,59 +21,8 @@ class Bot:
         self.play_rect = kn.Rect(0, 0, CARD_SIZE)
         self.play_rect.center = kn.Vec2(SCN_SIZE.x / 2, CARD_SIZE.y / 2 + 40)
 
-    def draw_card(self) -> Card | None:
-        if not self.deck:
-            self.played_card = None
-            return None
-
-        fused_card = self._maybe_fuse_from_deck()
-        if fused_card is not None:
-            self.hand.append(fused_card)
-            self.played_card = fused_card
-            return fused_card
-
-        card = self.deck.pop()
-        self.hand.append(card)
-        self.played_card = card
-        return card
-
-    def draw_to_hand(self) -> Card | None:
-        if not self.deck:
-            return None
-
-        card = self.deck.pop()
-        self.hand.append(card)
-        return card
-
     def render_played_card(self) -> None:
         if self.played_card is None:
             return
 
-        kn.renderer.draw(get_card_texture(self.played_card.ID), dst=self.play_rect)
-
-    def _maybe_fuse_from_deck(self) -> Card | None:
-        if len(self.deck) < 2:
-            return None
-
-        if random() >= 0.5:
-            return None
-
-        indices = list(range(len(self.deck)))
-        shuffle(indices)
-
-        for i, first in enumerate(indices):
-            for second in indices[i + 1:]:
-                fusion = check_fusion((self.deck[first].ID, self.deck[second].ID))
-                if fusion is None:
-                    continue
-
-                for idx in sorted((first, second), reverse=True):
-                    self.deck.pop(idx)
-
-                return Card(
-                    ID=fusion.ID,
-                    attack=fusion.attack,
-                    defense=fusion.defense
-                )
-
-        return None
+        draw_card(self.played_card.ID, self.play_rect, LAYER_PLAYED)
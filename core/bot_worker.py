@@ -0,0 +1,76 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+
+from core.engine import TOP_CARD
+from core.search_bot import SearchBot
+
+
+# MYTHIC_BOT_THINK_MS is the worker's budget; it runs off the frame, so it can afford far more than a frame
+BOT_THINK_ENV = "MYTHIC_BOT_THINK_MS"
+DEFAULT_THINK_MS = 250.0
+
+_worker_bot: SearchBot | None = None
+
+
+def _decide(snapshot: tuple) -> int:
+    # Runs in the worker process, which keeps one bot and its transposition table across decisions
+    global _worker_bot
+    if _worker_bot is None:
+        _worker_bot = SearchBot.from_env(BOT_THINK_ENV, DEFAULT_THINK_MS)
+    return _worker_bot.decide(snapshot)
+
+
+class BotWorker:
+    """
+    Bot policy that thinks in a separate process. submit() hands over the match as it stands at
+    the start of the player's turn; choose() takes the answer if it is in, and otherwise makes the
+    SearchBot's greedy quick() pick on the same snapshot, which never searches. A process rather than a thread keeps the search off
+    the GIL the render loop needs.
+    """
+
+    def __init__(self):
+        self.fallback = SearchBot()
+        self.future: Future | None = None
+        self.fallbacks = 0      # decisions the worker did not deliver in time
+        self._snapshot: tuple | None = None
+        self._executor: ProcessPoolExecutor | None = None
+
+    def submit(self, engine) -> None:
+        if self.future is not None:
+            self.future.cancel()
+
+        self._snapshot = self.fallback.snapshot(engine)
+        try:
+            self.future = self._pool().submit(_decide, self._snapshot)
+        except RuntimeError:
+            self.future = None  # pool is broken or shut down; the fallback picks in-frame
+
+    def ready(self) -> bool:
+        return self.future is None or self.future.done()
+
+    def choose(self, engine) -> int:
+        future, self.future = self.future, None
+        snapshot, self._snapshot = self._snapshot, None
+
+        if future is not None and future.done() and not future.cancelled() and future.exception() is None:
+            choice = future.result()
+            if choice == TOP_CARD or choice in engine.bot_index.available:
+                return choice
+
+        self.fallbacks += 1
+        if future is not None:
+            future.cancel()
+        if snapshot is None:
+            snapshot = self.fallback.snapshot(engine)
+        return self.fallback.quick(snapshot)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        # Spawned, not forked: the parent holds a window and GPU context the child must not inherit
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"))
+        return self._executor
@@ -1,10 +1,20 @@
 import pykraken as kn
+from core.hit_index import HitIndex
+from core.render_queue import get_render_queue, LAYER_BUTTON, LAYER_BUTTON_TEXT
+from core.text_cache import get_text_cache
+
+
+HOVER_TEXT_COLOR = '#FFAE70'
 
 
 class Button:
-    def __init__(self, text: kn.Text):
-        self.text = text
-        self.rect = text.get_rect()
+    def __init__(self, font: kn.Font, label: str, hit_index: HitIndex):
+        # Plain and hover text are separate cached Texts, so hovering never recolours or re-lays out
+        texts = get_text_cache()
+        self.text = texts.get(font, label)
+        self.hover_text = texts.get(font, label, HOVER_TEXT_COLOR)
+
+        self.rect = self.text.get_rect()
         self.rect.inflate((24, 12))
 
         self.outline_rect = self.rect.copy()
@@ -14,30 +24,34 @@ class Button:
         self.base_color = '#283540'
         self.outline_color = '#14182E'
         self.hover_color = '#30435a'
-        self.base_text_color = self.text.color
-        self.hover_text_color = '#FFAE70'
+
+        self.hovered = False    # as of the last draw
+
+        self.hit_index = hit_index
+        hit_index.add(self, self.rect, LAYER_BUTTON)
 
     def is_clicked(self) -> bool:
-        mouse_pos = kn.mouse.get_pos()
-        mouse_pressed = kn.mouse.is_just_pressed(kn.M_LEFT)
-        return mouse_pressed and kn.collision.overlap(self.rect, mouse_pos)
+        return kn.mouse.is_just_pressed(kn.M_LEFT) and self.is_hovered()
 
-    def draw(self, pos: kn.Vec2, anchor: kn.Anchor = kn.Anchor.TOP_LEFT) -> None:
-        mouse_pos = kn.mouse.get_pos()
+    def is_hovered(self) -> bool:
+        return self.hit_index.pick(kn.mouse.get_pos()) is self
+
+    def hover_changed(self) -> bool:
+        return self.is_hovered() != self.hovered
 
+    def draw(self, pos: kn.Vec2, anchor: kn.Anchor = kn.Anchor.TOP_LEFT) -> None:
         if anchor == kn.Anchor.BOTTOM_MID:
             self.rect.bottom_mid = pos
         elif anchor == kn.Anchor.CENTER:
             self.rect.center = pos
+        self.hit_index.move(self)
 
-        hovered = kn.collision.overlap(self.rect, mouse_pos)
+        hovered = self.hovered = self.is_hovered()
 
         self.outline_rect.center = self.rect.center
-        kn.draw.rect(self.outline_rect, self.outline_color)
-        kn.draw.rect(self.rect, self.hover_color if hovered else self.base_color)
-
-        # Text color swap on hover
-        prev_color = self.text.color
-        self.text.color = self.hover_text_color if hovered else self.base_text_color
-        self.text.draw(self.rect.center, kn.Anchor.CENTER)
-        self.text.color = prev_color
+        queue = get_render_queue()
+        queue.rect(self.outline_rect, self.outline_color, LAYER_BUTTON)
+        queue.rect(self.rect, self.hover_color if hovered else self.base_color, LAYER_BUTTON)
+
+        text = self.hover_text if hovered else self.text
+        queue.text(text, self.rect.center, LAYER_BUTTON_TEXT, kn.Anchor.CENTER)
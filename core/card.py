@@ -1,23 +1,13 @@
-import math
 from enum import Enum, auto
 import pykraken as kn
-from core.deck import get_card_texture
-from core.utils import exp_lerp
+from core.card_motion import get_card_motion, DRAG_TILT_MAX, DRAG_TILT_SENS, ENTRY_OFFSET, HOVER_EPSILON
+from core.card_spec import CardSpec
+from core.deck import draw_card, draw_card_shadow, get_card_texture, get_shadow_region
+from core.render_queue import LAYER_HAND, LAYER_HAND_SHADOW
 
-
-HOVER_RAISE = 20
-HOVER_SCALE = 1.08
-HOVER_ROTATION = math.radians(6)
-HOVER_EPSILON = 1e-3
-HOVER_SPEED = 10.0
-
-ENTRY_OFFSET = 280
-ENTRY_EPSILON = 1e-3
-ENTRY_SPEED = 8.0
-
-DRAG_TILT_MAX = math.radians(12)
-DRAG_TILT_DAMP = 8.0
-DRAG_TILT_SENS = 0.004
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from core.hit_index import HitIndex
 
 
 class CardLocation(Enum):
@@ -27,57 +17,100 @@ class CardLocation(Enum):
 
 
 class Card:
-    card_shadow : kn.Texture | None = None
+    """
+    One physical copy of a card. Stats come from the shared CardSpec; rects and
+    a CardMotion row are only allocated once the copy enters the hand.
+    """
+
+    __slots__ = (
+        "anchor_pos", "base_size", "drag_offset", "drag_tilt_dir", "dragging", "hit_index",
+        "hit_rect", "location", "motion", "motion_slot", "rect", "shadow_dst", "spec",
+    )
+
     shadow_rect : kn.Rect | None = None
 
-    def __init__(
-        self,
-        ID: int,
-        attack: int,
-        defense: int
-    ):
-        if Card.card_shadow is None:
-            Card.card_shadow = kn.Texture("assets/cards/card_shadow.png")
-            Card.shadow_rect = Card.card_shadow.get_rect()
-
-        self.ID = ID
-        self.attack = attack
-        self.defense = defense
+    # Bumped whenever any card changes location so hand layouts know to rebuild
+    layout_version = 0
+
+    def __init__(self, spec: CardSpec):
+        self.spec = spec
         self.location = CardLocation.HAND
-        self.rotation = 0.0
-        self.scale = 1.0
-        self.dy = 0.0
+        self.rect: kn.Rect | None = None
+        self.hit_index: "HitIndex | None" = None     # set while the card is a pick target
+
+    @property
+    def ID(self) -> int:
+        return self.spec.ID
+
+    @property
+    def attack(self) -> int:
+        return self.spec.attack
+
+    @property
+    def defense(self) -> int:
+        return self.spec.defense
+
+    # Animated values live in the shared CardMotion arrays
+    @property
+    def scale(self) -> float:
+        return float(self.motion.scale[self.motion_slot])
+
+    @property
+    def dy(self) -> float:
+        return float(self.motion.dy[self.motion_slot])
+
+    @property
+    def rotation(self) -> float:
+        return float(self.motion.rotation[self.motion_slot])
+
+    @property
+    def drag_rotation(self) -> float:
+        return float(self.motion.drag_rotation[self.motion_slot])
+
+    @property
+    def hover_amount(self) -> float:
+        return float(self.motion.hover_amount[self.motion_slot])
+
+    def _init_render_state(self) -> None:
+        if Card.shadow_rect is None:
+            Card.shadow_rect = kn.Rect(0, 0, get_shadow_region().size)
 
         self.dragging = False
         self.drag_offset = kn.Vec2()
+        self.drag_tilt_dir = 1.0
 
-        self.texture = get_card_texture(ID)
-        self.rect = self.texture.get_rect()
+        _, region = get_card_texture(self.spec.ID)
+        self.rect = kn.Rect(0, 0, region.size)
+        self.hit_rect = kn.Rect(0, 0, region.size)
+        self.shadow_dst = Card.shadow_rect.copy()
         self.anchor_pos = kn.Vec2(self.rect.x, self.rect.y)
         self.base_size = kn.Vec2(self.rect.size.x, self.rect.size.y)
 
-        self.hover_amount = 0.0
-        self.hover_target = 0.0
-        self.hover_offset = 0.0
-        self.entry_progress = 0.0
-        self.entry_target = 0.0
-        self.entry_offset = 0.0
-        self.drag_rotation = 0.0
-        self.drag_tilt_dir = 1.0
+        self.motion = get_card_motion()
+        self.motion_slot = self.motion.add(self)
 
-    def draw_shadow(self) -> None:
-        combined_rotation = self.rotation + self.drag_rotation
+    def release_render_state(self) -> None:
+        """Give the CardMotion row back once the copy has left the table for good."""
+        if self.rect is not None:
+            self.motion.remove(self.motion_slot)
+            self.rect = None
 
-        scaled_shadow_rect = kn.rect.scale_by(Card.shadow_rect, self.scale)
-        scaled_shadow_rect.center = self.rect.center
+    def draw_shadow(self, layer: int = LAYER_HAND_SHADOW) -> None:
+        motion, slot = self.motion, self.motion_slot
+        combined_rotation = float(motion.rotation[slot] + motion.drag_rotation[slot])
+        scale = float(motion.scale[slot])
 
-        prev_angle = Card.card_shadow.angle
-        Card.card_shadow.angle = combined_rotation
-        kn.renderer.draw(Card.card_shadow, dst=scaled_shadow_rect)
-        Card.card_shadow.angle = prev_angle
+        # Scaled about the card's center, written in place
+        shadow = self.shadow_dst
+        shadow.w = Card.shadow_rect.w * scale
+        shadow.h = Card.shadow_rect.h * scale
+        shadow.x = self.rect.x + (self.rect.w - shadow.w) * 0.5
+        shadow.y = self.rect.y + (self.rect.h - shadow.h) * 0.5
+        draw_card_shadow(shadow, layer, combined_rotation)
 
     def set_drag(self, drag: bool):
         self.dragging = drag
+        self._sync_motion_flags()
         if drag:
             self.drag_offset = kn.mouse.get_pos() - self.rect.top_left
             height = self.rect.size.y or 1.0
@@ -87,131 +120,99 @@ class Card:
             self.drag_tilt_dir = 1.0
 
     def move_to(self, top_left: kn.Vec2) -> None:
-        self.anchor_pos = kn.Vec2(top_left.x, top_left.y)
-        self._sync_rect_with_anchor()
+        if self.anchor_pos.x == top_left.x and self.anchor_pos.y == top_left.y:
+            return
 
-    def contains_point(self, point: kn.Vec2) -> bool:
-        return kn.collision.overlap(self._hover_hit_rect(), point)
+        self.anchor_pos.x = top_left.x
+        self.anchor_pos.y = top_left.y
+        self._sync_rect_with_anchor()
 
     def update_drag_position(self) -> None:
-        if self.dragging:
-            self.rect.top_left = kn.mouse.get_pos() - self.drag_offset
-            rel_x = kn.mouse.get_rel().x
+        # Damping happens in CardMotion.step each tick; this only follows the mouse and adds the tilt impulse
+        if not self.dragging:
+            return
 
-            # impulse based on horizontal movement
-            self.drag_rotation += rel_x * DRAG_TILT_SENS * self.drag_tilt_dir
-            self.drag_rotation = max(-DRAG_TILT_MAX, min(DRAG_TILT_MAX, self.drag_rotation))
+        self.rect.top_left = kn.mouse.get_pos() - self.drag_offset
+        rel_x = kn.mouse.get_rel().x
 
-        # time-based damping so it feels the same at any FPS
-        self.drag_rotation *= math.exp(-DRAG_TILT_DAMP * kn.time.get_delta())
+        tilt = self.motion.drag_rotation
+        tilt[self.motion_slot] += rel_x * DRAG_TILT_SENS * self.drag_tilt_dir
+        tilt[self.motion_slot] = max(-DRAG_TILT_MAX, min(DRAG_TILT_MAX, tilt[self.motion_slot]))
 
     def begin_hand_entry(self) -> None:
-        self.location = CardLocation.HAND
-        self.entry_progress = 1.0
-        self.entry_target = 0.0
-        self.entry_offset = ENTRY_OFFSET
-        self.dy = self.entry_offset
+        if self.rect is None:
+            self._init_render_state()
+
+        self._set_location(CardLocation.HAND)
+        Card.layout_version += 1    # a fresh card joins the hand even if it was already marked HAND
+
+        motion, slot = self.motion, self.motion_slot
+        motion.entry_progress[slot] = 1.0
+        motion.entry_target[slot] = 0.0
+        motion.dy[slot] = ENTRY_OFFSET
+        motion.snap(slot)
         self._sync_rect_with_anchor()
 
     def start_drag(self) -> None:
-        self.entry_progress = 0.0
-        self.entry_offset = 0.0
-        self.set_hovered(False)
+        self.motion.entry_progress[self.motion_slot] = 0.0
         self._settle_hover()
-        self.location = CardLocation.DRAG
+        self._set_location(CardLocation.DRAG)
         self.set_drag(True)
 
     def place_in_slot(self, slot_rect: kn.Rect) -> None:
-        self.move_to(kn.Vec2(slot_rect.x, slot_rect.y))
+        self.move_to(slot_rect.top_left)
+        self.motion.entry_progress[self.motion_slot] = 0.0
         self._settle_hover()
         self.set_drag(False)
-        self.entry_progress = 0.0
-        self.entry_offset = 0.0
-        self.location = CardLocation.SLOT
+        self._set_location(CardLocation.SLOT)
 
     def return_to_hand(self) -> None:
         self.set_drag(False)
-        self.location = CardLocation.HAND
+        self._set_location(CardLocation.HAND)
+        self._sync_rect_with_anchor()
 
     def set_hovered(self, hovered: bool) -> None:
-        self.hover_target = 1.0 if hovered else 0.0
+        self.motion.hover_target[self.motion_slot] = 1.0 if hovered else 0.0
 
-    def update_hand_motion(self, dt: float) -> None:
-        self._update_entry_motion(dt)
-        self._update_hover_motion(dt)
+    def has_hover_elevation(self) -> bool:
+        return self.motion.hover_amount[self.motion_slot] > HOVER_EPSILON
 
-        if self.location is CardLocation.HAND and not self.dragging:
-            self.hover_offset = -HOVER_RAISE * self.hover_amount
-            self.dy = self.entry_offset + self.hover_offset
-            self.scale = 1.0 + (HOVER_SCALE - 1.0) * self.hover_amount
-            self.rotation = HOVER_ROTATION * self.hover_amount
-            self._sync_rect_with_anchor()
+    def _set_location(self, location: CardLocation) -> None:
+        if location is not self.location:
+            self.location = location
+            Card.layout_version += 1
+        self._sync_motion_flags()
 
-    def has_hover_elevation(self) -> bool:
-        return self.hover_amount > HOVER_EPSILON
+    def _sync_motion_flags(self) -> None:
+        self.motion.in_hand[self.motion_slot] = self.location is CardLocation.HAND and not self.dragging
 
     def _sync_rect_with_anchor(self) -> None:
-        size = self.base_size * self.scale
-        offset = (size - self.base_size) * 0.5
-        top_left = kn.Vec2(
-            self.anchor_pos.x - offset.x,
-            self.anchor_pos.y + self.dy - offset.y
-        )
-        self.rect = kn.Rect(top_left.x, top_left.y, size)
-
-    def _hover_hit_rect(self) -> kn.Rect:
-        size = self.base_size * self.scale
-        offset = (size - self.base_size) * 0.5
-        top_left = kn.Vec2(
-            self.anchor_pos.x - offset.x,
-            self.anchor_pos.y - offset.y
-        )
-        return kn.Rect(top_left.x, top_left.y, size)
+        # Drawn rect includes the entry/hover lift; the hit rect stays on the anchor so hover doesn't flicker
+        motion, slot = self.motion, self.motion_slot
+        scale = float(motion.scale[slot])
+
+        w = self.base_size.x * scale
+        h = self.base_size.y * scale
+        x = self.anchor_pos.x - (w - self.base_size.x) * 0.5
+        y = self.anchor_pos.y - (h - self.base_size.y) * 0.5
+
+        rect, hit = self.rect, self.hit_rect
+        rect.x, rect.y, rect.w, rect.h = x, y + float(motion.dy[slot]), w, h
+        hit.x, hit.y, hit.w, hit.h = x, y, w, h
+        if self.hit_index is not None:
+            self.hit_index.move(self)
 
     def _settle_hover(self) -> None:
-        self.hover_amount = 0.0
-        self.hover_target = 0.0
-        self.hover_offset = 0.0
-        self.scale = 1.0
-        self.rotation = 0.0
-        self.dy = self.entry_offset
+        motion, slot = self.motion, self.motion_slot
+        motion.hover_amount[slot] = 0.0
+        motion.hover_target[slot] = 0.0
+        motion.scale[slot] = 1.0
+        motion.rotation[slot] = 0.0
+        motion.dy[slot] = ENTRY_OFFSET * motion.entry_progress[slot]
+        motion.snap(slot)
         self._sync_rect_with_anchor()
 
-    def _update_entry_motion(self, dt: float) -> None:
-        if self.location is not CardLocation.HAND or self.dragging:
-            self.entry_progress = 0.0
-            self.entry_offset = 0.0
-            return
-
-        self.entry_progress = exp_lerp(
-            self.entry_progress,
-            self.entry_target,
-            ENTRY_SPEED,
-            dt
-        )
-
-        if abs(self.entry_target - self.entry_progress) < ENTRY_EPSILON:
-            self.entry_progress = self.entry_target
-
-        self.entry_offset = ENTRY_OFFSET * self.entry_progress
-
-    def _update_hover_motion(self, dt: float) -> None:
-        if self.location is not CardLocation.HAND or self.dragging:
-            self.hover_target = 0.0
-
-        self.hover_amount = exp_lerp(
-            self.hover_amount,
-            self.hover_target,
-            HOVER_SPEED,
-            dt
-        )
-
-        if abs(self.hover_target - self.hover_amount) < HOVER_EPSILON:
-            self.hover_amount = self.hover_target
-
-    def draw(self):
-        combined_rotation = self.rotation + self.drag_rotation
-        prev_angle = self.texture.angle
-        self.texture.angle = combined_rotation
-        kn.renderer.draw(self.texture, dst=self.rect)
-        self.texture.angle = prev_angle
+    def draw(self, layer: int = LAYER_HAND):
+        motion, slot = self.motion, self.motion_slot
+        combined_rotation = float(motion.rotation[slot] + motion.drag_rotation[slot])
+        draw_card(self.spec.ID, self.rect, layer, combined_rotation)
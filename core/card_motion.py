@@ -0,0 +1,190 @@
+import math
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from core.card import Card
+
+
+HOVER_RAISE = 20
+HOVER_SCALE = 1.08
+HOVER_ROTATION = math.radians(6)
+HOVER_EPSILON = 1e-3
+HOVER_SPEED = 10.0
+
+ENTRY_OFFSET = 280
+ENTRY_EPSILON = 1e-3
+ENTRY_SPEED = 8.0
+
+DRAG_TILT_MAX = math.radians(12)
+DRAG_TILT_DAMP = 8.0
+DRAG_TILT_SENS = 0.004
+DRAG_TILT_EPSILON = 1e-4
+
+INITIAL_CAPACITY = 32
+
+
+class CardMotion:
+    """
+    Hover, entry and drag-tilt state for every card on screen, one array row per card,
+    stepped in a single vectorized pass per tick. Cards hold a row index and read from here.
+    """
+
+    FIELDS = (
+        "entry_progress", "entry_target", "hover_amount", "hover_target",
+        "drag_rotation", "scale", "dy", "rotation",
+        "entry_prev", "hover_prev",     # values before the last tick, for blend()
+    )
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.cards: list["Card | None"] = []
+        self._free: list[int] = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        for name in self.FIELDS:
+            grown = np.zeros(capacity)
+            if hasattr(self, name):
+                old = getattr(self, name)
+                grown[:len(old)] = old
+            setattr(self, name, grown)
+
+        # Anchored in the hand and not being dragged: the only rows whose entry/hover animate
+        grown = np.zeros(capacity, dtype=bool)
+        if hasattr(self, "in_hand"):
+            grown[:len(self.in_hand)] = self.in_hand
+        self.in_hand = grown
+        self.scale[len(self.cards):] = 1.0
+
+        # Scratch rows for step() and blend(), written with out= so neither allocates arrays
+        self._step_delta = np.zeros(capacity)
+        self._step_settled = np.zeros(capacity, dtype=bool)
+        self._blend_entry = np.zeros(capacity)
+        self._blend_hover = np.zeros(capacity)
+        self._blend_dy = np.zeros(capacity)
+        self._blend_scale = np.zeros(capacity)
+        self._blend_moved = np.zeros(capacity, dtype=bool)
+        self._blend_changed = np.zeros(capacity, dtype=bool)
+
+    def add(self, card: "Card") -> int:
+        if self._free:
+            slot = self._free.pop()
+            self.cards[slot] = card
+        else:
+            slot = len(self.cards)
+            if slot == len(self.scale):
+                self._allocate(2 * slot)
+            self.cards.append(card)
+
+        for name in self.FIELDS:
+            getattr(self, name)[slot] = 0.0
+        self.scale[slot] = 1.0
+        self.in_hand[slot] = False
+        return slot
+
+    def remove(self, slot: int) -> None:
+        self.cards[slot] = None
+        self.in_hand[slot] = False
+        self._free.append(slot)
+
+    def snap(self, slot: int) -> None:
+        """Drop the previous-tick values of a row whose entry or hover was set directly."""
+        self.entry_prev[slot] = self.entry_progress[slot]
+        self.hover_prev[slot] = self.hover_amount[slot]
+
+    def clear(self) -> None:
+        self.cards.clear()
+        self._free.clear()
+        self.in_hand[:] = False
+
+    def step(self, dt: float) -> None:
+        n = len(self.cards)
+        if not n:
+            return
+
+        hand = self.in_hand[:n]
+        entry = self.entry_progress[:n]
+        entry_target = self.entry_target[:n]
+        hover = self.hover_amount[:n]
+        hover_target = self.hover_target[:n]
+        tilt = self.drag_rotation[:n]
+
+        self.entry_prev[:n] = entry
+        self.hover_prev[:n] = hover
+
+        delta = self._step_delta[:n]
+        settled = self._step_settled[:n]
+
+        # Same exponential approach as utils.exp_lerp, one alpha for every row
+        np.subtract(entry_target, entry, out=delta)
+        delta *= 1.0 - math.exp(-ENTRY_SPEED * dt)
+        entry += delta
+        entry *= hand       # rows out of the hand drop back to the start of their entry
+        np.subtract(entry_target, entry, out=delta)
+        np.less(np.abs(delta, out=delta), ENTRY_EPSILON, out=settled)
+        np.copyto(entry, entry_target, where=settled)
+
+        hover_target *= hand
+        np.subtract(hover_target, hover, out=delta)
+        delta *= 1.0 - math.exp(-HOVER_SPEED * dt)
+        hover += delta
+        np.subtract(hover_target, hover, out=delta)
+        np.less(np.abs(delta, out=delta), HOVER_EPSILON, out=settled)
+        np.copyto(hover, hover_target, where=settled)
+
+        tilt *= math.exp(-DRAG_TILT_DAMP * dt)
+        np.less(np.abs(tilt, out=delta), DRAG_TILT_EPSILON, out=settled)
+        np.copyto(tilt, 0.0, where=settled)
+
+    def blend(self, alpha: float) -> None:
+        """Derive the drawn lift, scale and rotation of hand cards between the last two ticks."""
+        n = len(self.cards)
+        hand = self.in_hand[:n]
+        if not hand.any():
+            return
+
+        # Every row is blended in place, but only hand rows are written back
+        entry = self._blend_entry[:n]
+        np.subtract(self.entry_progress[:n], self.entry_prev[:n], out=entry)
+        entry *= alpha
+        entry += self.entry_prev[:n]
+
+        hover = self._blend_hover[:n]
+        np.subtract(self.hover_amount[:n], self.hover_prev[:n], out=hover)
+        hover *= alpha
+        hover += self.hover_prev[:n]
+
+        scale = self._blend_scale[:n]
+        np.multiply(hover, HOVER_SCALE - 1.0, out=scale)
+        scale += 1.0
+
+        dy = self._blend_dy[:n]
+        np.multiply(entry, ENTRY_OFFSET, out=dy)
+        np.multiply(hover, HOVER_RAISE, out=entry)
+        dy -= entry
+        hover *= HOVER_ROTATION
+
+        # Only cards that actually moved need their rects rewritten
+        moved = self._blend_moved[:n]
+        changed = self._blend_changed[:n]
+        np.not_equal(dy, self.dy[:n], out=moved)
+        np.not_equal(scale, self.scale[:n], out=changed)
+        moved |= changed
+        moved &= hand
+
+        np.copyto(self.dy[:n], dy, where=hand)
+        np.copyto(self.scale[:n], scale, where=hand)
+        np.copyto(self.rotation[:n], hover, where=hand)
+
+        if moved.any():
+            cards = self.cards
+            for slot in np.flatnonzero(moved).tolist():
+                cards[slot]._sync_rect_with_anchor()
+
+
+_motion = CardMotion()
+
+
+def get_card_motion() -> CardMotion:
+    return _motion
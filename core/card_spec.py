@@ -0,0 +1,23 @@
+from typing import NamedTuple
+
+
+class CardSpec(NamedTuple):
+    """Immutable per-ID card data, shared by every copy of the card."""
+
+    ID: int
+    card_class: str
+    attack: int
+    defense: int
+    combo: tuple[int, int] | None = None
+
+    @property
+    def is_fusion(self) -> bool:
+        return self.card_class == "Fusion"
+
+
+_specs: dict[int, CardSpec] = {}
+
+
+def intern_spec(spec: CardSpec) -> CardSpec:
+    """Return the shared spec for this ID, registering this one if it is the first."""
+    return _specs.setdefault(spec.ID, spec)
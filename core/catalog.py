@@ -0,0 +1,194 @@
+import hashlib
+import json
+import marshal
+import os
+from collections import defaultdict
+from functools import cache
+from itertools import combinations
+from typing import Any
+
+import numpy as np
+
+from core.card_spec import CardSpec, intern_spec
+
+
+CARDS_PATH = "assets/cards.json"
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 1
+
+CARD_CLASSES = ("Base", "Fusion")
+
+# Result ID stored in the fusion matrix for pairs that do not fuse
+NO_FUSION = -1
+
+Combo = tuple[int, int]
+
+# Compiled record layout: (id, class, attack, defense, combo or None, image_path)
+Record = tuple[int, str, int, int, Combo | None, str]
+
+
+def compile_fusion_lut(fusions: dict[Combo, Any], width: int) -> list:
+    """Flatten recipes into a symmetric width x width row-major list of results (None for no fusion)."""
+    lut = [None] * (width * width)
+    for (lhs, rhs), card in fusions.items():
+        lut[lhs * width + rhs] = card
+        lut[rhs * width + lhs] = card
+    return lut
+
+
+def compile_fusion_matrix(fusions: dict[Combo, Any], width: int) -> np.ndarray:
+    """Dense symmetric width x width matrix of result IDs, NO_FUSION where a pair does not fuse."""
+    matrix = np.full((width, width), NO_FUSION, dtype=np.int16)
+    for (lhs, rhs), card in fusions.items():
+        matrix[lhs, rhs] = card.ID
+        matrix[rhs, lhs] = card.ID
+    return matrix
+
+
+@cache
+def pair_indices(count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of every unordered pair among `count` items, lhs and rhs, in itertools.combinations order."""
+    lhs, rhs = zip(*combinations(range(count), 2)) if count >= 2 else ((), ())
+    return np.array(lhs, dtype=np.intp), np.array(rhs, dtype=np.intp)
+
+
+class FusionRecipes:
+    """Recipes compiled for O(1) pair checks, vectorized batch checks and indexing by ingredient."""
+
+    def __init__(self, fusions: dict[Combo, Any], width: int):
+        self.combos = list(fusions)
+        self.results = [fusions[combo] for combo in self.combos]
+        self.width = width
+        self.lut = compile_fusion_lut(fusions, width)
+
+        # Result IDs with one spare row/col at the end, so an empty slot of -1 never fuses
+        self.ids = compile_fusion_matrix(fusions, width + 1)
+
+        self.by_ingredient: dict[int, list[int]] = defaultdict(list)
+        for recipe, (lhs, rhs) in enumerate(self.combos):
+            self.by_ingredient[lhs].append(recipe)
+            if rhs != lhs:
+                self.by_ingredient[rhs].append(recipe)
+
+    def check(self, combo: Combo):
+        return self.lut[combo[0] * self.width + combo[1]]
+
+    def check_pairs(self, lhs_ids, rhs_ids) -> np.ndarray:
+        """Result IDs for many (lhs, rhs) pairs at once, NO_FUSION where a pair does not fuse."""
+        return self.ids[np.asarray(lhs_ids), np.asarray(rhs_ids)]
+
+    def hand_pairs(self, card_ids) -> np.ndarray:
+        """Result IDs for every pair in a hand or deck; (..., n) IDs give (..., n choose 2) in pair_indices order."""
+        card_ids = np.asarray(card_ids)
+        lhs, rhs = pair_indices(card_ids.shape[-1])
+        return self.ids[card_ids[..., lhs], card_ids[..., rhs]]
+
+
+class CardCatalog:
+    """Every card in cards.json, indexed by ID, plus the fusion tables compiled from it."""
+
+    def __init__(self, records: list[Record]):
+        self.specs = [
+            intern_spec(CardSpec(card_id, card_class, attack, defense, combo))
+            for card_id, card_class, attack, defense, combo, _ in records
+        ]
+        self.image_paths = [record[5] for record in records]
+
+        self.base_specs = [spec for spec in self.specs if not spec.is_fusion]
+        self.fusions = {spec.combo: spec for spec in self.specs if spec.is_fusion}
+
+        self.width = len(self.specs)
+        self.recipes = FusionRecipes(self.fusions, self.width)
+
+
+_catalog: CardCatalog | None = None
+
+
+def get_catalog(path: str = CARDS_PATH) -> CardCatalog:
+    global _catalog
+
+    if _catalog is None:
+        _catalog = CardCatalog(_load_records(path))
+    return _catalog
+
+
+def _load_records(path: str) -> list[Record]:
+    cache_path = path + CACHE_SUFFIX
+    stat = os.stat(path)
+    cached = _read_cache(cache_path)
+
+    if cached is not None and cached[1:3] == (stat.st_mtime_ns, stat.st_size):
+        return cached[4]
+
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()
+
+    # Touched but unchanged (e.g. a fresh checkout): keep the records, refresh the stamp
+    if cached is not None and cached[3] == digest:
+        records = cached[4]
+    else:
+        records = _compile_records(json.loads(source)["cards"])
+
+    _write_cache(cache_path, (CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest, records))
+    return records
+
+
+def _compile_records(card_data_list: list[dict]) -> list[Record]:
+    records: list[Record] = []
+
+    for position, card_data in enumerate(card_data_list):
+        card_id = card_data["id"]
+        if card_id != position:
+            raise ValueError(f"Card IDs must match their position in cards.json: id {card_id} at {position}")
+
+        card_class = card_data["class"]
+        if card_class not in CARD_CLASSES:
+            raise ValueError(f"Card {card_id} has unknown class {card_class!r}")
+
+        attack, defense = card_data["attack"], card_data["defense"]
+        if not isinstance(attack, int) or not isinstance(defense, int):
+            raise TypeError(f"Card {card_id} attack and defense must be integers")
+
+        combo = None
+        if card_class == "Fusion":
+            lhs, rhs = card_data["combo"]
+            combo = (lhs, rhs)
+
+        records.append((card_id, card_class, attack, defense, combo, card_data["image_path"]))
+
+    base_ids = {record[0] for record in records if record[1] != "Fusion"}
+    seen_combos: set[frozenset[int]] = set()
+    for card_id, _, _, _, combo, _ in records:
+        if combo is None:
+            continue
+        if not set(combo) <= base_ids:
+            raise ValueError(f"Fusion {card_id} combo {combo} must use base card IDs")
+        if frozenset(combo) in seen_combos:
+            raise ValueError(f"Fusion {card_id} repeats the combo {combo}")
+        seen_combos.add(frozenset(combo))
+
+    return records
+
+
+def _read_cache(cache_path: str) -> tuple | None:
+    try:
+        with open(cache_path, "rb") as f:
+            cached = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(cached, tuple) or len(cached) != 5 or cached[0] != CACHE_VERSION:
+        return None
+    return cached
+
+
+def _write_cache(cache_path: str, cached: tuple) -> None:
+    # Write-then-rename so a concurrent reader never sees a half-written cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump(cached, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # A read-only install just parses the JSON every launch
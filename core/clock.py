@@ -0,0 +1,47 @@
+import os
+
+
+# Game logic and animation advance in fixed ticks; drawing runs at its own rate and blends between them.
+TICK_RATE = 60
+MAX_TICKS_PER_FRAME = 5     # after a long stall, drop time rather than spiral trying to catch up
+
+# MYTHIC_FPS caps the render rate; 0 or below leaves it uncapped
+RENDER_FPS_ENV = "MYTHIC_FPS"
+DEFAULT_RENDER_FPS = 240
+
+
+def render_fps() -> int:
+    value = os.environ.get(RENDER_FPS_ENV)
+    if not value:
+        return DEFAULT_RENDER_FPS
+    try:
+        return int(value)
+    except ValueError:
+        return DEFAULT_RENDER_FPS
+
+
+class FixedStep:
+    """Accumulates frame time and hands it out as whole ticks of `dt` seconds."""
+
+    def __init__(self, rate: int = TICK_RATE, max_ticks: int = MAX_TICKS_PER_FRAME):
+        self.dt = 1.0 / rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.ticks = 0      # ticks run in total
+
+    def advance(self, frame_dt: float) -> int:
+        """Add one frame's worth of time and return how many ticks are due."""
+        self.accumulator += frame_dt
+        due = int(self.accumulator / self.dt)
+        if due > self.max_ticks:
+            self.accumulator -= (due - self.max_ticks) * self.dt
+            due = self.max_ticks
+
+        self.accumulator -= due * self.dt
+        self.ticks += due
+        return due
+
+    @property
+    def alpha(self) -> float:
+        """How far the frame sits between the last tick and the next, in [0, 1)."""
+        return self.accumulator / self.dt
@@ -1,82 +1,76 @@
 import pykraken as kn
-from random import shuffle
-import json
+from random import Random, shuffle
+from core.atlas import load_atlas_index
+from core.catalog import FusionRecipes, get_catalog
+from core.engine import COPIES_PER_CARD
+from core.render_queue import get_render_queue
+from core.resources import get_resources
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from core.card import Card
 
 
-Combo = tuple[int, int]
+# Every card face and the shared shadow live in one atlas texture; cards draw sub-rects of it.
+_atlas: kn.Texture | None = None
+_card_regions: list[kn.Rect] = []
+_shadow_region: kn.Rect | None = None
 
-_card_textures: list[kn.Texture] = []
-_fusion_table: dict[Combo, "Card"] = {}
+# Compiled once from cards.json; FusionRecipes.check is a single indexed load into its flat ID x ID table
+_fusion_recipes: FusionRecipes | None = None
 
 
 def load_fusion_table() -> None:
-    from core.card import Card
-    global _fusion_table
+    global _fusion_recipes
 
-    if _fusion_table:
+    if _fusion_recipes is not None:
         return  # Already loaded
 
-    with open("assets/cards.json") as f:
-        for card_data in json.load(f)["cards"]:
-            if card_data["class"] != "Fusion":
-                continue
+    _fusion_recipes = get_catalog().recipes
 
-            combo = tuple(card_data["combo"])
-            _fusion_table[combo] = Card(
-                ID=card_data["id"],
-                attack=card_data["attack"],
-                defense=card_data["defense"]
-            )
 
+def get_fusion_recipes() -> FusionRecipes:
+    if _fusion_recipes is None:
+        load_fusion_table()
+    return _fusion_recipes
 
-def check_fusion(combo: Combo) -> "Card | None":
-    card = _fusion_table.get(combo)
-    flipped_card = _fusion_table.get((combo[1], combo[0]))
 
-    if card is not None:
-        return card
-    if flipped_card is not None:
-        return flipped_card
+def load_card_textures() -> None:
+    global _atlas, _card_regions, _shadow_region
 
-    return None
+    if _atlas is not None:
+        return  # Already loaded
 
+    index = load_atlas_index()
+    if len(index.cards) != get_catalog().width:
+        raise RuntimeError("The card atlas is out of date with cards.json; run build_atlas.py")
 
-def load_card_textures() -> None:
-    global _card_textures
+    _atlas = get_resources().texture(index.image)
+    _card_regions = [kn.Rect(*region) for region in index.cards]
+    _shadow_region = kn.Rect(*index.shadow)
 
-    if _card_textures:
-        return  # Already loaded
 
-    with open("assets/cards.json") as f:
-        for card_data in json.load(f)["cards"]:
-            _card_textures.append(kn.Texture(card_data["image_path"]))
+def get_card_texture(index: int) -> tuple[kn.Texture, kn.Rect]:
+    """The shared atlas and the source rect of this card's face within it."""
+    return _atlas, _card_regions[index]
 
 
-def get_card_texture(index: int) -> kn.Texture:
-    return _card_textures[index]
+def get_shadow_region() -> kn.Rect:
+    return _shadow_region
 
 
-def load_deck() -> list["Card"]:
-    from core.card import Card
+def draw_card(index: int, dst: kn.Rect, layer: int, angle: float = 0.0) -> None:
+    get_render_queue().texture(_atlas, dst, layer, _card_regions[index], angle)
 
-    with open("assets/cards.json") as f:
-        card_data_list = json.load(f)["cards"]
 
-    cards: list[Card] = []
-    for _ in range(2):  # Two of each card per deck
-        for card_data in card_data_list:
-            if card_data["class"] == "Fusion":
-                continue  # Skip fusion cards in deck loading
+def draw_card_shadow(dst: kn.Rect, layer: int, angle: float = 0.0) -> None:
+    get_render_queue().texture(_atlas, dst, layer, _shadow_region, angle)
 
-            cards.append(Card(
-                ID=card_data["id"],
-                attack=card_data["attack"],
-                defense=card_data["defense"]
-            ))
 
-    shuffle(cards)
+def load_deck(rng: Random | None = None) -> list["Card"]:
+    from core.card import Card
+
+    # Copies of the parsed catalog's base specs; cards.json is never re-read per match
+    cards = [Card(spec) for spec in get_catalog().base_specs * COPIES_PER_CARD]
+    (rng.shuffle if rng is not None else shuffle)(cards)
     return cards
@@ -0,0 +1,283 @@
+from collections import Counter, defaultdict
+from itertools import combinations
+from random import Random
+from typing import Any, NamedTuple
+
+from core.card_spec import CardSpec
+from core.catalog import Combo, FusionRecipes, get_catalog
+from core.enums import MatchOutcome
+
+
+STARTING_HEALTH = 50
+HAND_SIZE = 5
+COPIES_PER_CARD = 2
+MAX_REFILL = 2
+FUSE_CHANCE = 0.5
+
+# Bot decision: a recipe index to fuse from the deck, or this for the top card
+TOP_CARD = -1
+
+
+class Side:
+    """Window-free stand-in for Player/Bot: anything with health, deck and hand works."""
+
+    def __init__(self, deck: list):
+        self.health = STARTING_HEALTH
+        self.deck = deck
+        self.hand: list = []
+
+
+class PlayAction(NamedTuple):
+    lhs: Any = None
+    rhs: Any = None
+
+
+class DeckFusionIndex:
+    """
+    Multiset of a deck's card IDs plus the recipes it can currently make, kept in
+    step with pops and fusions so picking a fusion never scans the deck.
+    """
+
+    def __init__(self, deck: list, recipes: FusionRecipes):
+        self.deck = deck
+        self.recipes = recipes
+        self.counts: Counter[int] = Counter()
+        self.positions: dict[int, list[int]] = defaultdict(list)
+        for pos, card in enumerate(deck):
+            self.counts[card.ID] += 1
+            self.positions[card.ID].append(pos)
+
+        self.available: list[int] = []
+        self._slots: dict[int, int] = {}
+        for recipe in range(len(recipes.combos)):
+            self._refresh(recipe)
+
+    def pop(self):
+        card = self.deck.pop()
+        self.positions[card.ID].remove(len(self.deck))
+        self._discount(card.ID)
+        return card
+
+    def take_random_fusion(self, rng: Random):
+        if not self.available:
+            return None
+        return self.take_fusion(self.available[rng.randrange(len(self.available))], rng)
+
+    def take_fusion(self, recipe: int, rng: Random):
+        if recipe not in self._slots:
+            raise ValueError(f"Recipe {recipe} cannot be made from this deck")
+
+        for card_id in self.recipes.combos[recipe]:
+            self._remove_copy(card_id, rng)
+        return self.recipes.results[recipe]
+
+    def _remove_copy(self, card_id: int, rng: Random) -> None:
+        # Taking a random copy and moving the top card into its place keeps the rest uniformly shuffled.
+        spots = self.positions[card_id]
+        i = rng.randrange(len(spots))
+        pos = spots[i]
+        spots[i] = spots[-1]
+        spots.pop()
+
+        top = self.deck.pop()
+        last = len(self.deck)
+        if pos != last:
+            self.deck[pos] = top
+            top_spots = self.positions[top.ID]
+            top_spots[top_spots.index(last)] = pos
+
+        self._discount(card_id)
+
+    def _discount(self, card_id: int) -> None:
+        self.counts[card_id] -= 1
+        for recipe in self.recipes.by_ingredient[card_id]:
+            self._refresh(recipe)
+
+    def _refresh(self, recipe: int) -> None:
+        lhs, rhs = self.recipes.combos[recipe]
+        makeable = self.counts[lhs] > 0 and self.counts[rhs] > (lhs == rhs)
+
+        if makeable and recipe not in self._slots:
+            self._slots[recipe] = len(self.available)
+            self.available.append(recipe)
+        elif not makeable and recipe in self._slots:
+            slot = self._slots.pop(recipe)
+            moved = self.available.pop()
+            if moved != recipe:
+                self.available[slot] = moved
+                self._slots[moved] = slot
+
+
+def get_rules() -> tuple[list[CardSpec], dict[Combo, CardSpec]]:
+    catalog = get_catalog()
+    return catalog.base_specs, catalog.fusions
+
+
+def build_deck(rng: Random) -> list[CardSpec]:
+    cards = get_catalog().base_specs * COPIES_PER_CARD
+    rng.shuffle(cards)
+    return cards
+
+
+class MatchEngine:
+    """
+    Pure rules for one match. The round is split into the same phases the battle
+    timeline plays out, and step() runs them back to back for headless play.
+    """
+
+    def __init__(self, player, bot, recipes: FusionRecipes, rng: Random | None = None, bot_policy=None):
+        self.player = player
+        self.bot = bot
+        self.recipes = recipes
+        self.check_fusion = recipes.check
+        self.rng = rng if rng is not None else Random()
+        self.bot_index = DeckFusionIndex(bot.deck, recipes)
+
+        # Anything with choose(engine) -> recipe index or TOP_CARD; None keeps the coin flip
+        self.bot_policy = bot_policy
+        self.bot_choice = TOP_CARD
+
+        self.rounds = 0
+        self.outcome = MatchOutcome.ONGOING
+        self.player_card = None
+        self.bot_card = None
+        self.cards_used = 0
+
+    def deal(self) -> list:
+        return self._draw(self.player, HAND_SIZE)
+
+    def resolve_play(self, action: PlayAction):
+        lhs, rhs = action
+        if lhs is not None and rhs is not None:
+            return self.check_fusion((lhs.ID, rhs.ID))
+        return lhs if lhs is not None else rhs
+
+    def begin_round(self, action: PlayAction, draw_bot: bool = True):
+        played = self.resolve_play(action)
+        if played is None:
+            raise ValueError("Action does not produce a playable card")
+
+        self.player_card = played
+        self.bot_card = self.bot_draw() if draw_bot else None
+
+        self.cards_used = 0
+        for card in action:
+            if card is not None:
+                self.player.hand.remove(card)
+                self.cards_used += 1
+
+        return played
+
+    def draw_bot_card(self):
+        """The bot's half of begin_round(draw_bot=False), for callers still waiting on its decision."""
+        self.bot_card = self.bot_draw()
+        return self.bot_card
+
+    def resolve_player_attack(self) -> int:
+        if self.player_card is None or self.bot_card is None:
+            return 0
+
+        dmg_to_bot = max(0, self.player_card.attack - self.bot_card.defense)
+        self.bot.health -= dmg_to_bot
+        return dmg_to_bot
+
+    def resolve_bot_attack(self) -> int:
+        if self.player_card is None or self.bot_card is None:
+            return 0
+
+        dmg_to_player = max(0, self.bot_card.attack - self.player_card.defense)
+        self.player.health -= dmg_to_player
+        return dmg_to_player
+
+    def refill(self) -> list:
+        return self._draw(self.player, min(MAX_REFILL, self.cards_used))
+
+    def finish_round(self) -> MatchOutcome:
+        if self.bot_card is not None and self.bot_card in self.bot.hand:
+            self.bot.hand.remove(self.bot_card)
+
+        self.player_card = None
+        self.bot_card = None
+        self.cards_used = 0
+        self.rounds += 1
+
+        player, bot = self.player, self.bot
+        if player.health <= 0 and bot.health <= 0:
+            self.outcome = MatchOutcome.STALE
+        elif player.health <= 0:
+            self.outcome = MatchOutcome.LOSE
+        elif bot.health <= 0:
+            self.outcome = MatchOutcome.WIN
+        elif not (player.deck or player.hand) or not (bot.deck or bot.hand):
+            self.outcome = MatchOutcome.STALE
+
+        return self.outcome
+
+    def step(self, action: PlayAction) -> MatchOutcome:
+        self.begin_round(action)
+        self.resolve_player_attack()
+        self.resolve_bot_attack()
+        self.refill()
+        return self.finish_round()
+
+    def bot_draw(self):
+        if not self.bot.deck:
+            return None
+
+        if self.bot_policy is not None:
+            self.bot_choice = self.bot_policy.choose(self)
+            if self.bot_choice == TOP_CARD:
+                card = self.bot_index.pop()
+            else:
+                card = self.bot_index.take_fusion(self.bot_choice, self.rng)
+        else:
+            card = self._maybe_fuse_from_deck()
+            if card is None:
+                card = self.bot_index.pop()
+
+        self.bot.hand.append(card)
+        return card
+
+    def auto_action(self) -> PlayAction:
+        # Player-side autopilot for headless matches, mirroring the bot's coin flip over the hand.
+        hand = self.player.hand
+        if len(hand) >= 2 and self.rng.random() < FUSE_CHANCE:
+            for lhs, rhs in combinations(hand, 2):
+                if self.check_fusion((lhs.ID, rhs.ID)) is not None:
+                    return PlayAction(lhs, rhs)
+
+        return PlayAction(self.rng.choice(hand))
+
+    def _maybe_fuse_from_deck(self):
+        if len(self.bot.deck) < 2:
+            return None
+
+        if self.rng.random() >= FUSE_CHANCE:
+            return None
+
+        return self.bot_index.take_random_fusion(self.rng)
+
+    @staticmethod
+    def _draw(side, count: int) -> list:
+        drawn = []
+        for _ in range(count):
+            if not side.deck:
+                break
+            card = side.deck.pop()
+            side.hand.append(card)
+            drawn.append(card)
+        return drawn
+
+
+def new_match(seed: int | None = None) -> MatchEngine:
+    rng = Random(seed)
+    engine = MatchEngine(Side(build_deck(rng)), Side(build_deck(rng)), get_catalog().recipes, rng)
+    engine.deal()
+    return engine
+
+
+def play_match(seed: int | None = None) -> MatchEngine:
+    engine = new_match(seed)
+    while engine.outcome is MatchOutcome.ONGOING:
+        engine.step(engine.auto_action())
+    return engine
@@ -8,3 +8,10 @@ class StateEnum(IntEnum):
     WIN = auto()
     LOSE = auto()
     STALE = auto()
+
+
+class MatchOutcome(IntEnum):
+    ONGOING = 0
+    WIN = auto()
+    LOSE = auto()
+    STALE = auto()
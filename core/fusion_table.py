@@ -1,19 +1,25 @@
 import pykraken as kn
 from core.card import Card
-from core.deck import get_card_texture, check_fusion
+from core.card_spec import CardSpec
+from core.deck import draw_card, get_fusion_recipes
 from core.constants import CARD_SIZE, SCN_SIZE
+from core.hit_index import HitIndex
+from core.render_queue import get_render_queue, LAYER_TABLE, LAYER_TABLE_CARDS
+from core.resources import get_resources
+from core.timeline import Timeline
+
+
+SLIDE_DURATION = 0.8
+
 
 class FusionTable:
-    def __init__(self):
-        self.table_tex = kn.Texture("assets/fusion_table.png")
+    def __init__(self, hit_index: HitIndex):
+        self.hit_index = hit_index
+        self.table_tex = get_resources().texture("assets/fusion_table.png")
         self.table_rect = self.table_tex.get_rect()
 
         self.slot_gap = 60
 
-        self.lhs_card: Card | None = None
-        self.rhs_card: Card | None = None
-        self.fusion_result_card: Card | None = None
-
         mid_x, mid_y = SCN_SIZE / 2
         self.table_rect.center = (mid_x, mid_y)
         self._home_pos = kn.Vec2(self.table_rect.top_left.x, self.table_rect.top_left.y)
@@ -28,72 +34,111 @@ class FusionTable:
         self.fusion_result_rect = kn.Rect(0, 0, CARD_SIZE)
         self._sync_slot_positions()
 
-        self.hiding = False
-        self.hide_anim = kn.EasingAnimation(kn.ease.out_cubic, 0.8)
-        self.hide_anim.start_pos = self.table_rect.top_left
-        self.hide_anim.end_pos = self.table_rect.top_left + kn.Vec2(0, SCN_SIZE.y)
-        self.hide_anim_time = 0.8
+        # The two input slots are pick targets in their own right, identified by their rects
+        hit_index.add(self.lhs_rect, self.lhs_rect, LAYER_TABLE_CARDS)
+        hit_index.add(self.rhs_rect, self.rhs_rect, LAYER_TABLE_CARDS)
+
+        # The table only ever slides vertically; hide() and show() retarget the same tween
+        self.slide = Timeline()
+        self.slide_tween = self.slide.track("table").tween(
+            self.table_rect, "y", None, self._home_pos.y, 0.0, SLIDE_DURATION, kn.ease.out_cubic
+        )
+
+        # Where the table sat before the last tick, and where it is drawn between ticks
+        self._prev_y = self._home_pos.y
+        self.draw_rect = self.table_rect.copy()
+
+        # Slot cards are drawn shifted by the same blend; the queue keeps rects until flush, so one each
+        self._lhs_dst = kn.Rect(0, 0, CARD_SIZE)
+        self._rhs_dst = kn.Rect(0, 0, CARD_SIZE)
+        self._result_dst = kn.Rect(0, 0, CARD_SIZE)
+
+        self.reset()
+
+    def reset(self) -> None:
+        self.slide.stop()
+        self.table_rect.top_left = self._home_pos
+        self._prev_y = self._home_pos.y
+        self._sync_slot_positions()
+        self.clear()
+
+    # Slot contents only change through these, so the result is looked up once per change
+    @property
+    def lhs_card(self) -> Card | None:
+        return self._lhs_card
+
+    @property
+    def rhs_card(self) -> Card | None:
+        return self._rhs_card
+
+    @property
+    def fusion_result_card(self) -> Card | CardSpec | None:
+        return self._result
+
+    def set_lhs(self, card: Card | None) -> None:
+        self._lhs_card = card
+        self._refresh_result()
+
+    def set_rhs(self, card: Card | None) -> None:
+        self._rhs_card = card
+        self._refresh_result()
+
+    def clear(self) -> None:
+        self._lhs_card = None
+        self._rhs_card = None
+        self._refresh_result()
+
+    def _refresh_result(self) -> None:
+        lhs, rhs = self._lhs_card, self._rhs_card
+        if lhs is not None and rhs is not None:
+            self._result = get_fusion_recipes().check((lhs.ID, rhs.ID))
+        else:
+            # A lone card plays as itself
+            self._result = lhs or rhs
+
+    def release(self) -> None:
+        get_resources().release(self.table_tex)
 
     def hide(self) -> None:
-        self.hiding = True
-        self.hide_anim.start_pos = kn.Vec2(self.table_rect.top_left.x, self.table_rect.top_left.y)
-        self.hide_anim.end_pos = self._home_pos + kn.Vec2(0, SCN_SIZE.y)
-        self.hide_anim.restart()
+        self.slide_tween.end = self._home_pos.y + SCN_SIZE.y
+        self.slide.restart()
 
     def show(self) -> None:
-        self.hiding = True
-        current = kn.Vec2(self.table_rect.top_left.x, self.table_rect.top_left.y)
-        self.hide_anim.start_pos = current
-        self.hide_anim.end_pos = self._home_pos
-        self.hide_anim.restart()
+        self.slide_tween.end = self._home_pos.y
+        self.slide.restart()
 
     def _sync_slot_positions(self) -> None:
         center = self.table_rect.center
         self.lhs_rect.center = center + self.lhs_offset
         self.rhs_rect.center = center + self.rhs_offset
         self.fusion_result_rect.center = center + self.result_offset
+        self.hit_index.move(self.lhs_rect)
+        self.hit_index.move(self.rhs_rect)
 
-    def render(self) -> None:
-        if self.hiding:
-            self.table_rect.top_left = self.hide_anim.step()
-            if self.hide_anim.is_done:
-                self.hiding = False
-        self._sync_slot_positions()
-
-        kn.renderer.draw(self.table_tex, self.rhs_rect.center, anchor=kn.Anchor.CENTER)
-
-        def draw_slot(card: Card | None, rect: kn.Rect) -> bool:
-            if card is None:
-                return False
-
-            kn.renderer.draw(get_card_texture(card.ID), dst=rect)
-            return True
-
-        lhs_present = draw_slot(self.lhs_card, self.lhs_rect)
-        rhs_present = draw_slot(self.rhs_card, self.rhs_rect)
-
-        # If only one card is present, draw it in the fusion result slot
-        if lhs_present ^ rhs_present:
-            solo_card = self.lhs_card or self.rhs_card
-            kn.renderer.draw(
-                get_card_texture(solo_card.ID),
-                dst=self.fusion_result_rect
-            )
-            self.fusion_result_card = solo_card
-        else:
-            self.fusion_result_card = None
-
-        # If both cards are present, check for fusion result
-        if self.lhs_card is None or self.rhs_card is None:
+    def update(self, dt: float) -> None:
+        self._prev_y = self.table_rect.y
+        if self.slide.done:
             return
 
-        combo = (self.lhs_card.ID, self.rhs_card.ID)
-        fused_card = check_fusion(combo)
-        if fused_card is not None:
-            kn.renderer.draw(
-                get_card_texture(fused_card.ID),
-                dst=self.fusion_result_rect
-            )
-            self.fusion_result_card = fused_card
-        else:
-            self.fusion_result_card = None
+        self.slide.update(dt)
+        self._sync_slot_positions()
+
+    def render(self, alpha: float) -> None:
+        # The rhs slot sits at the table center, so the table rect is where the texture goes
+        draw_rect = self.draw_rect
+        draw_rect.x = self.table_rect.x
+        draw_rect.y = self._prev_y + (self.table_rect.y - self._prev_y) * alpha
+        get_render_queue().texture(self.table_tex, draw_rect, LAYER_TABLE)
+
+        offset = draw_rect.y - self.table_rect.y
+        if self._lhs_card is not None:
+            self._draw_slot_card(self._lhs_card.ID, self.lhs_rect, self._lhs_dst, offset)
+        if self._rhs_card is not None:
+            self._draw_slot_card(self._rhs_card.ID, self.rhs_rect, self._rhs_dst, offset)
+        if self._result is not None:
+            self._draw_slot_card(self._result.ID, self.fusion_result_rect, self._result_dst, offset)
+
+    @staticmethod
+    def _draw_slot_card(card_id: int, slot_rect: kn.Rect, dst: kn.Rect, offset: float) -> None:
+        dst.x, dst.y = slot_rect.x, slot_rect.y + offset
+        draw_card(card_id, dst, LAYER_TABLE_CARDS)
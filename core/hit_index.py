@@ -0,0 +1,131 @@
+from typing import Any
+
+import pykraken as kn
+
+
+CELL_SIZE = 128
+
+
+class _Entry:
+    __slots__ = ("bounds", "cells", "rank", "rect", "seq", "target", "z")
+
+    def __init__(self, target: Any, rect: kn.Rect, z: float, rank: int, seq: int):
+        self.target = target
+        self.rect = rect
+        self.z = z
+        self.rank = rank
+        self.seq = seq
+        self.bounds = (0.0, 0.0, 0.0, 0.0)
+        self.cells = (0, 0, -1, -1)
+
+
+class HitIndex:
+    """
+    Interactive rects bucketed into a uniform grid. Owners register a target with the rect
+    they keep up to date and call move() after changing it; pick() returns the topmost
+    target under a point: highest z first, then lowest rank, then the latest registered.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self.cell_size = cell_size
+        self._entries: dict[int, _Entry] = {}     # id(target) -> entry; targets need not be hashable
+        self._cells: dict[tuple[int, int], list[_Entry]] = {}
+        self._seq = 0
+
+        # Repeated picks at the same point return the last answer until something moves
+        self._version = 0
+        self._last_pick: tuple = ()
+        self._last_target: Any = None
+
+    def __contains__(self, target: Any) -> bool:
+        return id(target) in self._entries
+
+    def add(self, target: Any, rect: kn.Rect, z: float, rank: int = 0) -> None:
+        if id(target) in self._entries:
+            self.remove(target)
+
+        self._seq += 1
+        entry = self._entries[id(target)] = _Entry(target, rect, z, rank, self._seq)
+        self._place(entry)
+
+    def set_rank(self, target: Any, rank: int) -> None:
+        entry = self._entries.get(id(target))
+        if entry is not None and entry.rank != rank:
+            entry.rank = rank
+            self._version += 1
+
+    def remove(self, target: Any) -> None:
+        entry = self._entries.pop(id(target), None)
+        if entry is None:
+            return
+
+        self._unplace(entry)
+        self._version += 1
+
+    def move(self, target: Any) -> None:
+        entry = self._entries.get(id(target))
+        if entry is None:
+            return
+
+        rect = entry.rect
+        if entry.bounds == (rect.x, rect.y, rect.w, rect.h):
+            return
+
+        # Only re-bucket when the covered cells change; most moves stay inside the same ones
+        if self._cell_range(rect) != entry.cells:
+            self._unplace(entry)
+            self._place(entry)
+        else:
+            entry.bounds = (rect.x, rect.y, rect.w, rect.h)
+            self._version += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._cells.clear()
+        self._version += 1
+
+    def pick(self, point: kn.Vec2) -> Any:
+        x, y = point.x, point.y
+        key = (x, y, self._version)
+        if key == self._last_pick:
+            return self._last_target
+
+        best: _Entry | None = None
+        for entry in self._cells.get((int(x // self.cell_size), int(y // self.cell_size)), ()):
+            bx, by, bw, bh = entry.bounds
+            if not (bx <= x <= bx + bw and by <= y <= by + bh):
+                continue
+            if best is None or (entry.z, -entry.rank, entry.seq) > (best.z, -best.rank, best.seq):
+                best = entry
+
+        self._last_pick = key
+        self._last_target = best.target if best is not None else None
+        return self._last_target
+
+    def _cell_range(self, rect: kn.Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            int(rect.x // size), int(rect.y // size),
+            int((rect.x + rect.w) // size), int((rect.y + rect.h) // size),
+        )
+
+    def _place(self, entry: _Entry) -> None:
+        rect = entry.rect
+        entry.bounds = (rect.x, rect.y, rect.w, rect.h)
+        entry.cells = x0, y0, x1, y1 = self._cell_range(rect)
+
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells.setdefault((cx, cy), []).append(entry)
+        self._version += 1
+
+    def _unplace(self, entry: _Entry) -> None:
+        x0, y0, x1, y1 = entry.cells
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells[(cx, cy)]
+                bucket.remove(entry)
+                if not bucket:
+                    del cells[(cx, cy)]
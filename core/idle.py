@@ -0,0 +1,38 @@
+import pykraken as kn
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from states.base_state import BaseState
+
+
+# How long a parked screen sleeps between event polls; pykraken has no blocking event wait
+IDLE_POLL_MS = 15
+
+
+class IdleFrame:
+    """The last full frame of a static screen, re-presented instead of rebuilding it from scratch."""
+
+    def __init__(self):
+        self.texture: kn.Texture | None = None
+        self.rect: kn.Rect | None = None
+        self.owner: "BaseState | None" = None
+
+    def valid_for(self, state: "BaseState") -> bool:
+        return self.texture is not None and self.owner is state
+
+    def capture(self, state: "BaseState") -> None:
+        # Read back what was just drawn, before present() hands the buffer over
+        self.texture = kn.Texture(kn.renderer.read_pixels())
+        self.rect = self.texture.get_rect()
+        self.owner = state
+
+    def invalidate(self) -> None:
+        self.texture = None
+        self.owner = None
+
+    def draw(self) -> None:
+        kn.renderer.draw(self.texture, self.rect)
+
+    @staticmethod
+    def wait() -> None:
+        kn.time.delay(IDLE_POLL_MS)
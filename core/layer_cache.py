@@ -0,0 +1,28 @@
+import pykraken as kn
+from core.render_queue import get_render_queue, LAYER_BACKGROUND
+
+
+class LayerCache:
+    """
+    Every layer below `top` composed into one full-screen texture. A frame that submits
+    those layers and calls rebuild() refreshes it; frames in between just call draw().
+    """
+
+    def __init__(self, top: int):
+        self.top = top
+        self.texture: kn.Texture | None = None
+        self.rect: kn.Rect | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.texture is not None
+
+    def rebuild(self) -> None:
+        get_render_queue().capture(self.top, self._store)
+
+    def draw(self) -> None:
+        get_render_queue().texture(self.texture, self.rect, LAYER_BACKGROUND)
+
+    def _store(self, texture: kn.Texture) -> None:
+        self.texture = texture
+        self.rect = texture.get_rect()
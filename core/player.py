@@ -1,7 +1,12 @@
+from random import Random
 import pykraken as kn
 from core.card import Card, CardLocation
+from core.card_motion import get_card_motion
+from core.render_queue import LAYER_DRAG, LAYER_DRAG_SHADOW, LAYER_HAND, LAYER_HOVER
 from core.deck import load_deck
 from core.constants import SCN_SIZE, CARD_SIZE
+from core.engine import STARTING_HEALTH
+from core.hit_index import HitIndex
 
 
 # Horizontal gap between cards in hand for readability
@@ -9,19 +14,27 @@ HAND_GAP = 8
 
 
 class Player:
-    def __init__(self):
-        self.health = 50
+    def __init__(self, hit_index: HitIndex):
+        # Cards resting in the hand are pick targets; _indexed is the ones currently registered
+        self.hit_index = hit_index
+        self._indexed: list[Card] = []
+        self._dragged: list[Card] = []      # refilled in place every frame
+        self.reset()
+
+    def reset(self, rng: Random | None = None) -> None:
+        for card in self._indexed:
+            self._unindex(card)
+        self._indexed = []
+
+        self.health = STARTING_HEALTH
         self.hand: list[Card] = []
-        self.deck = load_deck()
+        self.deck = load_deck(rng)
 
-        for _ in range(5):
-            self.draw_card()
-
-    def draw_card(self) -> None:
-        if self.deck:
-            card = self.deck.pop()
-            self.hand.append(card)
-            card.begin_hand_entry()
+        # Hand cards at rest in the hand and their slot positions, rebuilt only when the hand changes
+        self._anchored: list[Card] = []
+        self._layout: list[kn.Vec2] = []
+        self._layout_version = -1
+        self._layout_count = -1
 
     def to_hand_pos(self, idx: int, count: int) -> kn.Vec2:
         total_width = count * CARD_SIZE.x + max(0, count - 1) * HAND_GAP
@@ -31,45 +44,62 @@ class Player:
             SCN_SIZE.y - CARD_SIZE.y - 50
         )
 
-    def render_hand(self) -> None:
-        dt = kn.time.get_delta()
-
-        anchored_cards = [card for card in self.hand if card.location is CardLocation.HAND]
-        total = len(anchored_cards)
-        mouse_pos = kn.mouse.get_pos()
+    def refresh_layout(self) -> None:
+        if self._layout_version == Card.layout_version and self._layout_count == len(self.hand):
+            return
+
+        self._anchored = [card for card in self.hand if card.location is CardLocation.HAND]
+        total = len(self._anchored)
+        self._layout = [self.to_hand_pos(idx, total) for idx in range(total)]
+        self._layout_version = Card.layout_version
+        self._layout_count = len(self.hand)
+
+        # Only cards that joined or left the hand touch the index
+        for card in self._indexed:
+            if card.location is not CardLocation.HAND or card not in self.hand:
+                self._unindex(card)
+        # Where neighbours overlap the lower hand index wins, as when the hand was scanned in order
+        for idx, card in enumerate(self._anchored):
+            if card.hit_index is None:
+                card.hit_index = self.hit_index
+                self.hit_index.add(card, card.hit_rect, LAYER_HAND, idx)
+            else:
+                self.hit_index.set_rank(card, idx)
+        self._indexed = list(self._anchored)
+
+    def _unindex(self, card: Card) -> None:
+        if card.hit_index is not None:
+            card.hit_index.remove(card)
+            card.hit_index = None
+
+    def render_hand(self, alpha: float) -> None:
+        self.refresh_layout()
+        anchored_cards = self._anchored
+
+        target = self.hit_index.pick(kn.mouse.get_pos())
+        hovered_card = target if isinstance(target, Card) else None
 
-        hovered_card: Card | None = None
-
-        # Position, hover detection, and motion
         for idx, card in enumerate(anchored_cards):
-            card.move_to(self.to_hand_pos(idx, total))
-
-            if hovered_card is None and card.contains_point(mouse_pos):
-                hovered_card = card
-
+            card.move_to(self._layout[idx])
             card.set_hovered(card is hovered_card)
+
+        dragged_cards = self._dragged
+        dragged_cards.clear()
+        for card in self.hand:
+            if card.location is CardLocation.DRAG:
+                dragged_cards.append(card)
+        for card in dragged_cards:
+            card.set_hovered(False)
             card.update_drag_position()
-            card.update_hand_motion(dt)
 
-        # Draw shadows for all anchored hand cards first
-        for card in anchored_cards:
-            card.draw_shadow()
+        # Motion is stepped on the fixed tick; frames only blend toward the latest step
+        get_card_motion().blend(alpha)
 
-        # Draw all hand cards except the hovered one
+        # Shadows sit under every hand card; the hovered card and dragged cards get their own layers on top
         for card in anchored_cards:
-            if card is hovered_card:
-                continue
-            card.draw()
-
-        # Draw hovered card on top
-        if hovered_card is not None:
-            hovered_card.draw()
+            card.draw_shadow()
+            card.draw(LAYER_HOVER if card is hovered_card else LAYER_HAND)
 
-        # Dragged cards render above everything else
-        for card in self.hand:
-            if card.location is CardLocation.DRAG:
-                card.set_hovered(False)
-                card.update_drag_position()
-                card.update_hand_motion(dt)
-                card.draw_shadow()
-                card.draw()
+        for card in dragged_cards:
+            card.draw_shadow(LAYER_DRAG_SHADOW)
+            card.draw(LAYER_DRAG)
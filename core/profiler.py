@@ -0,0 +1,149 @@
+import os
+import time
+from contextlib import nullcontext
+
+import numpy as np
+import pykraken as kn
+from core.render_queue import get_render_queue, LAYER_OVERLAY
+from core.resources import get_resources
+
+
+# MYTHIC_PROFILE=1 records for the whole run; F3 toggles the overlay (recording while it shows), F4 dumps the buffer.
+PROFILE_ENV = "MYTHIC_PROFILE"
+CSV_PATH = "frame_profile.csv"
+
+SCOPES = ("events", "tick", "update", "stats", "fusion_table", "play_sequence", "hand", "present")
+FRAME = len(SCOPES)    # last column holds the whole frame
+
+CAPACITY = 1024
+STATS_INTERVAL = 30    # frames between percentile refreshes for the overlay
+PERCENTILES = (50, 95, 99)
+
+OVERLAY_FONT = "kraken-clean"
+OVERLAY_FONT_SIZE = 16
+OVERLAY_POS = kn.Vec2(8, 8)
+OVERLAY_LINE = 18
+
+
+class _Scope:
+    __slots__ = ("column", "profiler", "start")
+
+    def __init__(self, profiler: "FrameProfiler", column: int):
+        self.profiler = profiler
+        self.column = column
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler._current[self.column] += time.perf_counter_ns() - self.start
+
+
+_NULL_SCOPE = nullcontext()
+
+
+class FrameProfiler:
+    """Per-frame scope timings in a fixed-size ring buffer of milliseconds, one row per frame."""
+
+    def __init__(self, capacity: int = CAPACITY):
+        self.samples = np.zeros((capacity, len(SCOPES) + 1), dtype=np.float32)
+        self.count = 0      # frames recorded in total; the ring holds the last min(count, capacity)
+        self.recording = False  # set from the environment; stays on whatever the overlay does
+        self.overlay = False
+        self.enabled = False    # recording or overlay
+
+        self._current = [0] * (len(SCOPES) + 1)
+        self._scopes = {name: _Scope(self, column) for column, name in enumerate(SCOPES)}
+        self._frame_start = 0
+
+        self._texts: list[kn.Text] = []
+        self._text_pos: list[kn.Vec2] = []
+        self._stats: np.ndarray | None = None
+
+    def scope(self, name: str):
+        return self._scopes[name] if self.enabled else _NULL_SCOPE
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._current[:] = [0] * len(self._current)
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+
+        self._current[FRAME] = time.perf_counter_ns() - self._frame_start
+        row = self.samples[self.count % len(self.samples)]
+        row[:] = self._current
+        row *= 1e-6
+        self.count += 1
+
+        if self.overlay and self.count % STATS_INTERVAL == 0:
+            self._stats = self.percentiles()
+            self._refresh_overlay()
+
+    def recorded(self) -> np.ndarray:
+        """The buffered rows, oldest first."""
+        capacity = len(self.samples)
+        if self.count <= capacity:
+            return self.samples[:self.count]
+        return np.roll(self.samples, -(self.count % capacity), axis=0)
+
+    def percentiles(self) -> np.ndarray:
+        """len(PERCENTILES) x columns, in milliseconds."""
+        rows = self.recorded()
+        if not len(rows):
+            return np.zeros((len(PERCENTILES), self.samples.shape[1]), dtype=np.float32)
+        return np.percentile(rows, PERCENTILES, axis=0)
+
+    def dump_csv(self, path: str = CSV_PATH) -> None:
+        rows = self.recorded()
+        if not len(rows):
+            return
+        header = ",".join(SCOPES + ("frame",))
+        np.savetxt(path, rows, fmt="%.4f", delimiter=",", header=header, comments="")
+
+    def toggle(self) -> None:
+        self.overlay = not self.overlay
+        self.enabled = self.recording or self.overlay
+
+    def handle_event(self, event: kn.Event) -> None:
+        if event.type != kn.KEY_DOWN:
+            return
+
+        if event.key == kn.K_F3:
+            self.toggle()
+        elif event.key == kn.K_F4:
+            self.dump_csv()
+
+    def draw_overlay(self) -> None:
+        if not self.overlay or self._stats is None:
+            return
+
+        queue = get_render_queue()
+        for text, pos in zip(self._texts, self._text_pos):
+            queue.text(text, pos, LAYER_OVERLAY)
+
+    def _refresh_overlay(self) -> None:
+        if not self._texts:
+            font = get_resources().font(OVERLAY_FONT, OVERLAY_FONT_SIZE)
+            self._texts = [kn.Text(font) for _ in range(len(SCOPES) + 3)]
+            self._text_pos = [OVERLAY_POS + kn.Vec2(0, line * OVERLAY_LINE) for line in range(len(self._texts))]
+
+        labels = ", ".join(f"p{p}" for p in PERCENTILES)
+        self._texts[0].text = f"{'scope':<14} {labels} (ms)"
+        for column, name in enumerate(SCOPES + ("frame",)):
+            p50, p95, p99 = self._stats[:, column]
+            self._texts[column + 1].text = f"{name:<14} {p50:6.2f} {p95:6.2f} {p99:6.2f}"
+
+        queue = get_render_queue()
+        self._texts[-1].text = f"draws: {queue.submitted} submitted, {queue.culled} culled, {queue.drawn} drawn"
+
+
+_profiler = FrameProfiler()
+_profiler.recording = _profiler.enabled = bool(os.environ.get(PROFILE_ENV))
+
+
+def get_profiler() -> FrameProfiler:
+    return _profiler
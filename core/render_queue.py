@@ -0,0 +1,156 @@
+from collections.abc import Callable
+
+import pykraken as kn
+from core.constants import SCN_WIDTH, SCN_HEIGHT
+
+
+# Draw layers, back to front. Within a layer commands are grouped by texture, so
+# anything that must overlap in a fixed order belongs in separate layers.
+LAYER_BACKGROUND = 0
+LAYER_HUD_BACK = 10
+LAYER_HUD = 11
+LAYER_HUD_TEXT = 12
+LAYER_BUTTON = 20
+LAYER_BUTTON_TEXT = 21
+LAYER_TABLE = 30
+LAYER_TABLE_CARDS = 31
+LAYER_PLAYED = 40
+LAYER_HAND_SHADOW = 50
+LAYER_HAND = 51
+LAYER_HOVER = 52
+LAYER_DRAG_SHADOW = 60
+LAYER_DRAG = 61
+LAYER_OVERLAY = 100
+
+# Rotated cards poke a little outside their rect, so only cull once clear of the window by this much
+CULL_MARGIN = 32
+
+_TEXTURE, _TEXT, _RECT = range(3)
+
+
+def _capture_layer(capture: tuple) -> int:
+    return capture[0]
+
+
+class RenderQueue:
+    """
+    Per-frame draw commands, flushed once before present. Commands keep references to
+    their rects and positions, so those must not change between submit and flush.
+    Command records are reused from frame to frame, so steady frames allocate none.
+    """
+
+    def __init__(self):
+        # [layer, sort key, submit order, kind, *args]; flushed records go back to _spare
+        self._commands: list[list] = []
+        self._spare: list[list] = []
+        self._captures: list[tuple[int, Callable[[kn.Texture], None]]] = []
+        # Counts for the last flushed frame
+        self.submitted = 0
+        self.culled = 0
+        self.drawn = 0
+
+    def texture(
+        self,
+        texture: kn.Texture,
+        dst: kn.Rect,
+        layer: int,
+        src: kn.Rect | None = None,
+        angle: float = 0.0
+    ) -> None:
+        self._submit(layer, id(texture), _TEXTURE, texture, dst, src, angle)
+
+    def text(
+        self,
+        text: kn.Text,
+        pos: kn.Vec2,
+        layer: int,
+        anchor: kn.Anchor = kn.Anchor.TOP_LEFT,
+        color=None
+    ) -> None:
+        self._submit(layer, id(text), _TEXT, text, pos, anchor, color)
+
+    def rect(self, rect: kn.Rect, color, layer: int) -> None:
+        self._submit(layer, 0, _RECT, rect, color, None, None)
+
+    def _submit(self, layer: int, key: int, kind: int, a, b, c, d) -> None:
+        commands = self._commands
+        command = self._spare.pop() if self._spare else [None] * 8
+        command[0] = layer
+        command[1] = key
+        command[2] = len(commands)
+        command[3] = kind
+        command[4] = a
+        command[5] = b
+        command[6] = c
+        command[7] = d
+        commands.append(command)
+
+    def capture(self, layer: int, on_capture: Callable[[kn.Texture], None]) -> None:
+        """During the next flush, hand a copy of the frame to on_capture once every layer below `layer` is drawn."""
+        self._captures.append((layer, on_capture))
+
+    def discard(self) -> None:
+        self._recycle()
+        self._captures.clear()
+
+    def _recycle(self) -> None:
+        # Drop the references so released textures and rects are not kept alive by spare records
+        for command in self._commands:
+            command[4] = command[5] = command[6] = command[7] = None
+        self._spare.extend(self._commands)
+        self._commands.clear()
+
+    def flush(self) -> None:
+        commands = self._commands
+        commands.sort()     # (layer, texture, submit order); the tail is never compared
+
+        captures = self._captures
+        captures.sort(key=_capture_layer)
+        next_capture = captures[0][0] if captures else None
+
+        culled = 0
+        for command in commands:
+            if next_capture is not None and command[0] >= next_capture:
+                next_capture = self._run_captures(command[0])
+
+            kind = command[3]
+            if kind == _TEXTURE:
+                _, _, _, _, texture, dst, src, angle = command
+                if (dst.x >= SCN_WIDTH + CULL_MARGIN or dst.y >= SCN_HEIGHT + CULL_MARGIN
+                        or dst.x + dst.w <= -CULL_MARGIN or dst.y + dst.h <= -CULL_MARGIN):
+                    culled += 1
+                    continue
+                if texture.angle != angle:
+                    texture.angle = angle
+                kn.renderer.draw(texture, dst, src)
+            elif kind == _TEXT:
+                _, _, _, _, text, pos, anchor, color = command
+                if color is not None:
+                    text.color = color
+                text.draw(pos, anchor)
+            else:
+                kn.draw.rect(command[4], command[5])
+
+        if next_capture is not None:
+            self._run_captures(None)
+
+        self.submitted = len(commands)
+        self.culled = culled
+        self.drawn = len(commands) - culled
+        self._recycle()
+
+    def _run_captures(self, layer: int | None) -> int | None:
+        # One readback serves every capture at or below `layer` (None: all that are left)
+        captures = self._captures
+        texture = kn.Texture(kn.renderer.read_pixels())
+        while captures and (layer is None or captures[0][0] <= layer):
+            _, on_capture = captures.pop(0)
+            on_capture(texture)
+        return captures[0][0] if captures else None
+
+
+_queue = RenderQueue()
+
+
+def get_render_queue() -> RenderQueue:
+    return _queue
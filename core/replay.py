@@ -0,0 +1,186 @@
+import hashlib
+import os
+import random
+import struct
+from enum import IntEnum
+from random import Random
+from typing import NamedTuple
+
+from core.catalog import get_catalog
+from core.clock import TICK_RATE
+from core.deck import load_deck
+from core.engine import MatchEngine, PlayAction, Side, TOP_CARD
+from core.enums import MatchOutcome
+from core.round_timing import ROUND_TIMES
+from core.timeline import Timeline
+
+
+# MYTHIC_REPLAY names the file each finished match is written to; unset, nothing is recorded
+REPLAY_ENV = "MYTHIC_REPLAY"
+
+MAGIC = b"MARP"
+VERSION = 2     # 2: the bot's decisions are logged as BOT actions; version 1 logs relied on its coin flip
+_HEADER = struct.Struct("<4sBQ8sI")     # magic, version, seed, final state hash, action count
+_ACTION = struct.Struct("<IBBB")        # tick, kind, hand index, slot
+
+LHS, RHS = 0, 1
+
+
+class ActionKind(IntEnum):
+    PLACE = 0       # hand card -> slot; whatever held the slot goes back to the hand
+    UNSLOT = 1      # slot card -> hand
+    PLAY = 2
+    BOT = 3         # the bot's decision for the round just played: recipe index + 1, or 0 for the top card
+
+
+class ReplayAction(NamedTuple):
+    tick: int
+    kind: ActionKind
+    card: int = 0   # index into the player's hand at the time of the action
+    slot: int = 0
+
+
+class Replay(NamedTuple):
+    seed: int
+    final_hash: bytes
+    actions: list[ReplayAction]
+
+
+class MatchStreams(NamedTuple):
+    """Independent RNG streams for one match, so one consumer drawing more never shifts another."""
+    player_deck: Random
+    bot_deck: Random
+    bot: Random
+
+
+def new_seed() -> int:
+    return random.getrandbits(64)
+
+
+def match_streams(seed: int) -> MatchStreams:
+    return MatchStreams(*(Random(f"{seed}:{name}") for name in MatchStreams._fields))
+
+
+def state_hash(engine: MatchEngine) -> bytes:
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(struct.pack("<iiiB", engine.player.health, engine.bot.health, engine.rounds, engine.outcome.value))
+    for cards in (engine.player.deck, engine.player.hand, engine.bot.deck, engine.bot.hand):
+        digest.update(struct.pack(f"<H{len(cards)}H", len(cards), *(card.ID for card in cards)))
+    return digest.digest()
+
+
+class ReplayRecorder:
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.actions: list[ReplayAction] = []
+
+    def record(self, tick: int, kind: ActionKind, card: int = 0, slot: int = 0) -> None:
+        self.actions.append(ReplayAction(tick, kind, card, slot))
+
+    def save(self, path: str, final_hash: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.seed, final_hash, len(self.actions)))
+            for action in self.actions:
+                f.write(_ACTION.pack(*action))
+
+
+class ScriptedBot:
+    """Bot policy that hands back logged decisions in order."""
+
+    def __init__(self, choices: list[int]):
+        self.choices = iter(choices)
+
+    def choose(self, engine: MatchEngine) -> int:
+        return next(self.choices, TOP_CARD)
+
+
+def replay_path() -> str | None:
+    return os.environ.get(REPLAY_ENV) or None
+
+
+def load_replay(path: str) -> Replay:
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, seed, final_hash, count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay")
+
+    actions = [
+        ReplayAction(tick, ActionKind(kind), card, slot)
+        for tick, kind, card, slot in _ACTION.iter_unpack(data[_HEADER.size:_HEADER.size + count * _ACTION.size])
+    ]
+    return Replay(seed, final_hash, actions)
+
+
+class ReplayMatch:
+    """
+    The battle screen's rules without a window: the same decks, slots and round timeline,
+    stepped one fixed tick at a time with recorded actions applied on their ticks.
+    """
+
+    def __init__(self, seed: int, bot_choices: list[int]):
+        streams = match_streams(seed)
+        player = Side(load_deck(streams.player_deck))
+        bot = Side(load_deck(streams.bot_deck))
+        self.engine = MatchEngine(player, bot, get_catalog().recipes, streams.bot, ScriptedBot(bot_choices))
+        self.engine.deal()
+
+        self.slots: list = [None, None]
+        self.ticks = 0
+        self.battling = False
+
+        self.timeline = Timeline()
+        track = self.timeline.track("round")
+        track.at(ROUND_TIMES.player_attack, self.engine.resolve_player_attack)
+        track.at(ROUND_TIMES.bot_attack, self.engine.resolve_bot_attack)
+        track.at(ROUND_TIMES.show_table, self.engine.refill)
+        track.at(ROUND_TIMES.finish, self.engine.finish_round)
+
+    def apply(self, action: ReplayAction) -> None:
+        slots = self.slots
+        if action.kind is ActionKind.PLACE:
+            card = self.engine.player.hand[action.card]
+            other = RHS - action.slot
+            if slots[other] is card:
+                slots[other] = None
+            slots[action.slot] = card
+        elif action.kind is ActionKind.UNSLOT:
+            slots[action.slot] = None
+        elif action.kind is ActionKind.PLAY:
+            self.engine.begin_round(PlayAction(*slots))
+            slots[:] = [None, None]
+            self.timeline.restart()
+            self.battling = True
+
+    def tick(self, dt: float) -> None:
+        self.ticks += 1
+        if self.battling:
+            self.timeline.update(dt)
+            if self.timeline.done:
+                self.battling = False
+
+    def run(self, actions: list[ReplayAction]) -> MatchEngine:
+        dt = 1.0 / TICK_RATE
+        pending = iter(actions)
+        action = next(pending, None)
+
+        while self.engine.outcome is MatchOutcome.ONGOING:
+            while action is not None and action.tick == self.ticks:
+                self.apply(action)
+                action = next(pending, None)
+
+            if action is None and not self.battling:
+                break
+            if action is not None and action.tick < self.ticks:
+                raise ValueError(f"Replay action out of order at tick {action.tick}")
+            self.tick(dt)
+
+        return self.engine
+
+
+def run_replay(replay: Replay) -> tuple[MatchEngine, bool]:
+    """Re-run a log headlessly; the flag says whether it reproduced the recorded final state."""
+    bot_choices = [action.card - 1 for action in replay.actions if action.kind is ActionKind.BOT]
+    engine = ReplayMatch(replay.seed, bot_choices).run(replay.actions)
+    return engine, state_hash(engine) == replay.final_hash
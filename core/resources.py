@@ -0,0 +1,76 @@
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+import pykraken as kn
+from core import trace
+
+
+# (kind, path, *load parameters); a different volume or point size is a different handle
+ResourceKey = tuple
+
+
+class ResourceCache:
+    """
+    Shared texture, audio and font handles keyed by path and load parameters.
+    Every acquire counts a reference; the handle is dropped once all owners release it.
+    """
+
+    def __init__(self):
+        self._handles: dict[ResourceKey, Any] = {}
+        self._refs: Counter[ResourceKey] = Counter()
+        self._keys: dict[int, ResourceKey] = {}    # id(handle) -> key, so owners release by handle
+        self.hits = 0
+        self.misses = 0
+
+    def texture(self, path: str) -> kn.Texture:
+        return self._acquire(("texture", path), lambda: kn.Texture(path))
+
+    def audio(self, path: str, volume: float = 1.0) -> kn.Audio:
+        return self._acquire(("audio", path, volume), lambda: kn.Audio(path, volume=volume))
+
+    def font(self, path: str, size: int) -> kn.Font:
+        return self._acquire(("font", path, size), lambda: kn.Font(path, size))
+
+    def release(self, handle: Any) -> None:
+        key = self._keys.get(id(handle))
+        if key is None:
+            return
+
+        self._refs[key] -= 1
+        if self._refs[key] <= 0:
+            del self._refs[key]
+            del self._keys[id(handle)]
+            del self._handles[key]
+
+    def refs(self, handle: Any) -> int:
+        key = self._keys.get(id(handle))
+        return self._refs[key] if key is not None else 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "resident": len(self._handles),
+            "refs": sum(self._refs.values()),
+        }
+
+    def _acquire(self, key: ResourceKey, load: Callable[[], Any]) -> Any:
+        handle = self._handles.get(key)
+        if handle is None:
+            self.misses += 1
+            with trace.asset_span(key[0], key[1]):
+                handle = self._handles[key] = load()
+            self._keys[id(handle)] = key
+        else:
+            self.hits += 1
+
+        self._refs[key] += 1
+        return handle
+
+
+_resources = ResourceCache()
+
+
+def get_resources() -> ResourceCache:
+    return _resources
@@ -0,0 +1,31 @@
+from typing import NamedTuple
+
+
+# Seconds per phase of a played round; the battle screen and headless replays share these
+TRAVEL_DURATION = 0.65
+SHAKE_DURATION = 0.35
+SHAKE_GAP_DURATION = 0.35
+EXIT_DURATION = 0.55
+TABLE_SHOW_DURATION = 0.8
+
+# Latest point in the travel that the bot's card may still set off; past it the bot stops waiting on its worker
+BOT_COLLECT_BY = TRAVEL_DURATION * 0.5
+
+
+class RoundTimes(NamedTuple):
+    player_attack: float
+    bot_attack: float
+    exit: float
+    show_table: float
+    finish: float
+
+
+def round_times() -> RoundTimes:
+    player_attack = TRAVEL_DURATION
+    bot_attack = player_attack + SHAKE_DURATION + SHAKE_GAP_DURATION
+    exit_at = bot_attack + SHAKE_DURATION
+    show_table = exit_at + EXIT_DURATION
+    return RoundTimes(player_attack, bot_attack, exit_at, show_table, show_table + TABLE_SHOW_DURATION)
+
+
+ROUND_TIMES = round_times()
@@ -0,0 +1,268 @@
+import os
+from random import Random
+from time import perf_counter
+from typing import NamedTuple
+
+from core.catalog import get_catalog
+from core.engine import TOP_CARD
+
+
+# MYTHIC_BOT_BUDGET_MS caps the wall-clock time of one decision, MYTHIC_BOT_NODES the nodes expanded;
+# whichever runs out first ends the search with the best move of the last depth it finished.
+# Search never runs inside a frame: a missed deadline falls back to quick(), which does no lookahead.
+BOT_BUDGET_ENV = "MYTHIC_BOT_BUDGET_MS"
+BOT_NODES_ENV = "MYTHIC_BOT_NODES"
+DEFAULT_BUDGET_MS = 4.0
+DEFAULT_NODE_BUDGET = 200_000
+
+MAX_DEPTH = 6               # rounds of lookahead
+HAND_SAMPLES = 3            # player hands drawn from the unseen cards per chance node
+TABLE_LIMIT = 200_000       # transposition entries kept between decisions
+WIN_SCORE = 1000.0
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+class _OutOfBudget(Exception):
+    pass
+
+
+class SearchState(NamedTuple):
+    """What the bot knows at the start of a round: health, its deck's contents (not their order) and the player's unseen cards."""
+    bot_health: int
+    player_health: int
+    bot_counts: tuple           # per card ID, the bot's remaining deck
+    player_pool: tuple          # per card ID, player cards not yet played: hand and deck together
+    hand_size: int
+
+
+class Snapshot(NamedTuple):
+    state: SearchState
+    deck_empty: bool            # nothing left to draw; the engine never asks, but a decision still has an answer
+
+
+class SearchBot:
+    """
+    Expectimax bot policy for MatchEngine. The bot plays its next draw or a recipe it can fuse
+    from its deck. Its draw is a chance node over what is left in the deck, and the player's hand
+    is a chance node over sampled hands from the cards the player has not played yet; each hand
+    answers with any single card or fusable pair, weighted evenly. Deeper rounds are searched one
+    at a time and values are shared through a transposition table.
+    """
+
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS, node_budget: int = DEFAULT_NODE_BUDGET):
+        catalog = get_catalog()
+        self.specs = catalog.specs
+        self.recipes = catalog.recipes
+        self.width = catalog.width
+
+        self.budget = budget_ms / 1000.0
+        self.node_budget = node_budget
+        self.table: dict[int, float] = {}
+        self._hands: dict[tuple, list] = {}     # (pool, hand size) -> sampled hands
+        self._answers: dict[tuple, list] = {}   # hand -> the player's options with it
+
+        self.nodes = 0
+        self.depth = 0      # deepest search finished by the last decision
+        self._deadline = 0.0
+
+    @classmethod
+    def from_env(cls, budget_env: str = BOT_BUDGET_ENV, default_ms: float = DEFAULT_BUDGET_MS) -> "SearchBot":
+        return cls(_env_number(budget_env, default_ms), int(_env_number(BOT_NODES_ENV, DEFAULT_NODE_BUDGET)))
+
+    def choose(self, engine) -> int:
+        return self.decide(self.snapshot(engine))
+
+    def snapshot(self, engine) -> Snapshot:
+        """Everything a decision reads, as plain tuples that can be handed to another process."""
+        bot_counts = [0] * self.width
+        for card_id, count in engine.bot_index.counts.items():
+            bot_counts[card_id] = count
+
+        # Cards still with the player are the starting deck minus everything played face up,
+        # so the hand and deck are only ever read together
+        player_pool = [0] * self.width
+        for card in engine.player.deck:
+            player_pool[card.ID] += 1
+        for card in engine.player.hand:
+            player_pool[card.ID] += 1
+
+        state = SearchState(
+            engine.bot.health, engine.player.health, tuple(bot_counts), tuple(player_pool), len(engine.player.hand)
+        )
+        return Snapshot(state, not engine.bot.deck)
+
+    def decide(self, snapshot: Snapshot) -> int:
+        state, deck_empty = snapshot
+        if deck_empty:
+            return TOP_CARD
+
+        if len(self.table) > TABLE_LIMIT:
+            self.table.clear()
+            self._hands.clear()
+        self.nodes = 0
+        self.depth = 0
+        self._deadline = perf_counter() + self.budget
+
+        best = TOP_CARD
+        for depth in range(1, MAX_DEPTH + 1):
+            try:
+                scored = [
+                    (self._option_value(state, outcomes, depth), choice)
+                    for choice, outcomes in self._bot_options(state.bot_counts)
+                ]
+            except _OutOfBudget:
+                break
+            best = max(scored, key=lambda item: item[0])[1]
+            self.depth = depth
+        return best
+
+    def quick(self, snapshot: Snapshot) -> int:
+        """Greedy pick for when there is no time to search: the strongest fusion the deck can make if it beats an average draw."""
+        state, deck_empty = snapshot
+        if deck_empty:
+            return TOP_CARD
+
+        counts = state.bot_counts
+        best = TOP_CARD
+        best_value = sum(count * self._strength(card_id) for card_id, count in enumerate(counts)) / sum(counts)
+        for recipe, (lhs, rhs) in enumerate(self.recipes.combos):
+            if counts[lhs] and counts[rhs] > (lhs == rhs):
+                value = self._strength(self.recipes.results[recipe].ID)
+                if value > best_value:
+                    best, best_value = recipe, value
+        return best
+
+    def _strength(self, card_id: int) -> int:
+        spec = self.specs[card_id]
+        return spec.attack + spec.defense
+
+    def _spend(self) -> None:
+        self.nodes += 1
+        if self.nodes >= self.node_budget or perf_counter() >= self._deadline:
+            raise _OutOfBudget
+
+    def _bot_options(self, counts: tuple) -> list:
+        # (choice, [(weight, card ID, deck counts after)]); the next draw is a chance node
+        total = sum(counts)
+        draws = [
+            (count / total, card_id, self._without(counts, card_id))
+            for card_id, count in enumerate(counts) if count
+        ]
+        options = [(TOP_CARD, draws)]
+
+        for recipe, (lhs, rhs) in enumerate(self.recipes.combos):
+            if counts[lhs] and counts[rhs] > (lhs == rhs):
+                after = self._without(self._without(counts, lhs), rhs)
+                options.append((recipe, [(1.0, self.recipes.results[recipe].ID, after)]))
+        return options
+
+    def _sample_hands(self, pool: tuple, hand_size: int) -> list:
+        # (weight, hand); a fixed draw per pool keeps every decision reproducible from its snapshot
+        key = (pool, hand_size)
+        hands = self._hands.get(key)
+        if hands is not None:
+            return hands
+
+        rng = Random(hash(key))
+        cards = [card_id for card_id, count in enumerate(pool) for _ in range(count)]
+        seen: dict[tuple, int] = {}
+        for _ in range(HAND_SAMPLES):
+            hand = tuple(sorted(rng.sample(cards, hand_size)))
+            seen[hand] = seen.get(hand, 0) + 1
+
+        hands = self._hands[key] = [(hits / HAND_SAMPLES, hand) for hand, hits in seen.items()]
+        return hands
+
+    def _player_options(self, hand: tuple) -> list:
+        options = self._answers.get(hand)
+        if options is not None:
+            return options
+
+        options = [(card_id, (card_id,)) for card_id in sorted(set(hand))]
+        pairs = set()
+        for i, lhs in enumerate(hand):
+            for rhs in hand[i + 1:]:
+                result = self.recipes.check((lhs, rhs))
+                if result is not None and (lhs, rhs) not in pairs:
+                    pairs.add((lhs, rhs))
+                    options.append((result.ID, (lhs, rhs)))
+
+        self._answers[hand] = options
+        return options
+
+    @staticmethod
+    def _without(counts: tuple, card_id: int) -> tuple:
+        counts = list(counts)
+        counts[card_id] -= 1
+        return tuple(counts)
+
+    def _option_value(self, state: SearchState, outcomes: list, depth: int) -> float:
+        return sum(weight * self._round_value(state, card_id, counts, depth) for weight, card_id, counts in outcomes)
+
+    def _max_node(self, state: SearchState, depth: int) -> float:
+        key = hash((state, depth))
+        value = self.table.get(key)
+        if value is not None:
+            return value
+
+        self._spend()
+        value = max(
+            self._option_value(state, outcomes, depth)
+            for _, outcomes in self._bot_options(state.bot_counts)
+        )
+        self.table[key] = value
+        return value
+
+    def _round_value(self, state: SearchState, bot_card_id: int, bot_counts: tuple, depth: int) -> float:
+        bot_health, player_health, _, pool, hand_size = state
+        bot_card = self.specs[bot_card_id]
+
+        total = 0.0
+        for weight, hand in self._sample_hands(pool, hand_size):
+            # Chance nodes are charged too, so even a one-round pass stops on the deadline
+            self._spend()
+            options = self._player_options(hand)
+            hand_total = 0.0
+            for card_id, used in options:
+                player_card = self.specs[card_id]
+                bot_after = bot_health - max(0, player_card.attack - bot_card.defense)
+                player_after = player_health - max(0, bot_card.attack - player_card.defense)
+
+                pool_after = pool
+                for used_id in used:
+                    pool_after = self._without(pool_after, used_id)
+
+                terminal = self._terminal(bot_after, player_after, bot_counts, pool_after)
+                if terminal is not None:
+                    hand_total += terminal
+                elif depth <= 1:
+                    hand_total += bot_after - player_after
+                else:
+                    # Refills put the hand back to its size until the deck runs dry
+                    after = SearchState(
+                        bot_after, player_after, bot_counts, pool_after, min(hand_size, sum(pool_after))
+                    )
+                    hand_total += self._max_node(after, depth - 1)
+            total += weight * hand_total / len(options)
+        return total
+
+    @staticmethod
+    def _terminal(bot_health: int, player_health: int, bot_counts: tuple, pool: tuple) -> float | None:
+        if bot_health <= 0 and player_health <= 0:
+            return 0.0
+        if player_health <= 0:
+            return WIN_SCORE + bot_health
+        if bot_health <= 0:
+            return -WIN_SCORE - player_health
+        if not any(bot_counts) or not any(pool):
+            return 0.0
+        return None
@@ -1,4 +1,7 @@
 import pykraken as kn
+from core.render_queue import get_render_queue, LAYER_HUD, LAYER_HUD_BACK, LAYER_HUD_TEXT
+from core.resources import get_resources
+from core.text_cache import Counter, get_digit_strip
 
 HEALTH_OFFSET = kn.Vec2(192, 121)
 DECK_OFFSET = kn.Vec2(192, 33)
@@ -8,59 +11,68 @@ RIBBON_OFFSET = kn.Vec2(40, -8)
 
 class Stats:
     panel_texture: kn.Texture | None = None
-    panel_rect: kn.Rect | None = None
     ribbon_texture: kn.Texture | None = None
-    ribbon_rect: kn.Rect | None = None
 
     def __init__(self, font: kn.Font, font_sm: kn.Font, health: int, deck_size: int, name: str):
         if Stats.panel_texture is None:
-            Stats.panel_texture = kn.Texture("assets/stats_panel.png")
-            Stats.panel_rect = Stats.panel_texture.get_rect()
+            Stats.panel_texture = get_resources().texture("assets/stats_panel.png")
         if Stats.ribbon_texture is None:
-            Stats.ribbon_texture = kn.Texture("assets/name_ribbon.png")
-            Stats.ribbon_rect = Stats.ribbon_texture.get_rect()
+            Stats.ribbon_texture = get_resources().texture("assets/name_ribbon.png")
+
+        # Per panel, since queued draws keep a reference to their destination until the flush
+        self.panel_rect = Stats.panel_texture.get_rect()
+        self.ribbon_rect = Stats.ribbon_texture.get_rect()
 
         self.name_txt = kn.Text(font_sm)
         self.name_txt.text = name
         self.name_rect = self.name_txt.get_rect()
         self.name_rect.inflate((64, 0))
 
-        self.health_txt = kn.Text(font)
-        self.health_txt.text = str(health)
+        # Counters tick often, so they are placed from pre-laid digit glyphs
+        digits = get_digit_strip(font)
+        self.health_counter = Counter(digits, health)
+        self.deck_counter = Counter(digits, deck_size)
+
+        # Set whenever a number changes, so a cached HUD knows to recompose
+        self.dirty = True
 
-        self.deck_txt = kn.Text(font)
-        self.deck_txt.text = str(deck_size)
+    def reset(self, health: int, deck_size: int) -> None:
+        self.set_health(health)
+        self.set_deck_size(deck_size)
 
     def set_health(self, health: int) -> None:
-        self.health_txt.text = str(health)
+        if self.health_counter.set(health):
+            self.dirty = True
 
     def set_deck_size(self, size: int) -> None:
-        self.deck_txt.text = str(size)
+        if self.deck_counter.set(size):
+            self.dirty = True
 
     def render(self, pos: kn.Vec2, anchor: kn.Anchor) -> None:
         if anchor == kn.Anchor.TOP_LEFT:
-            Stats.panel_rect.top_left = pos
+            self.panel_rect.top_left = pos
 
-            Stats.ribbon_rect.top_left = Stats.panel_rect.bottom_left + RIBBON_OFFSET
-            self.name_rect.top_left = Stats.panel_rect.bottom_left + NAME_OFFSET
+            self.ribbon_rect.top_left = self.panel_rect.bottom_left + RIBBON_OFFSET
+            self.name_rect.top_left = self.panel_rect.bottom_left + NAME_OFFSET
 
-            health_pos = Stats.panel_rect.top_left + HEALTH_OFFSET
-            deck_pos = Stats.panel_rect.top_left + DECK_OFFSET
+            health_pos = self.panel_rect.top_left + HEALTH_OFFSET
+            deck_pos = self.panel_rect.top_left + DECK_OFFSET
 
         elif anchor == kn.Anchor.TOP_RIGHT:
-            Stats.panel_rect.top_right = pos
+            self.panel_rect.top_right = pos
 
             # Mirror offsets so right-side ribbon/name/text align symmetrically
-            Stats.ribbon_rect.top_right = Stats.panel_rect.bottom_right + kn.Vec2(-RIBBON_OFFSET.x, RIBBON_OFFSET.y)
-            self.name_rect.top_right = Stats.panel_rect.bottom_right + kn.Vec2(-NAME_OFFSET.x - 4, NAME_OFFSET.y)
+            self.ribbon_rect.top_right = self.panel_rect.bottom_right + kn.Vec2(-RIBBON_OFFSET.x, RIBBON_OFFSET.y)
+            self.name_rect.top_right = self.panel_rect.bottom_right + kn.Vec2(-NAME_OFFSET.x - 4, NAME_OFFSET.y)
 
-            health_pos = Stats.panel_rect.top_right + kn.Vec2(-HEALTH_OFFSET.x, HEALTH_OFFSET.y)
-            deck_pos = Stats.panel_rect.top_right + kn.Vec2(-DECK_OFFSET.x, DECK_OFFSET.y)
+            health_pos = self.panel_rect.top_right + kn.Vec2(-HEALTH_OFFSET.x, HEALTH_OFFSET.y)
+            deck_pos = self.panel_rect.top_right + kn.Vec2(-DECK_OFFSET.x, DECK_OFFSET.y)
 
-        kn.renderer.draw(Stats.ribbon_texture, dst=Stats.ribbon_rect)
-        kn.renderer.draw(Stats.panel_texture, dst=Stats.panel_rect)
+        queue = get_render_queue()
+        queue.texture(Stats.ribbon_texture, self.ribbon_rect, LAYER_HUD_BACK)
+        queue.texture(Stats.panel_texture, self.panel_rect, LAYER_HUD)
 
-        self.health_txt.draw(health_pos)
-        self.deck_txt.draw(deck_pos)
+        self.health_counter.draw(health_pos, LAYER_HUD_TEXT)
+        self.deck_counter.draw(deck_pos, LAYER_HUD_TEXT)
 
-        self.name_txt.draw(self.name_rect.top_mid, anchor=kn.Anchor.TOP_MID)
+        queue.text(self.name_txt, self.name_rect.top_mid, LAYER_HUD_TEXT, kn.Anchor.TOP_MID)
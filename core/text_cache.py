@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+import pykraken as kn
+from core.render_queue import get_render_queue
+
+
+TEXT_CACHE_SIZE = 256
+DIGITS = "-0123456789"
+
+
+class TextCache:
+    """
+    Laid-out kn.Text objects keyed by (font, colour, string), least recently used evicted
+    first. A font handle is one point size, so the font stands in for (font, size).
+    """
+
+    def __init__(self, capacity: int = TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self._texts: OrderedDict[tuple, kn.Text] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, font: kn.Font, string: str, color=None) -> kn.Text:
+        key = (font, None if color is None else tuple(kn.Color(color)), string)
+        text = self._texts.get(key)
+        if text is not None:
+            self.hits += 1
+            self._texts.move_to_end(key)
+            return text
+
+        self.misses += 1
+        text = kn.Text(font)
+        text.text = string
+        if color is not None:
+            text.color = color
+
+        self._texts[key] = text
+        if len(self._texts) > self.capacity:
+            self._texts.popitem(last=False)
+        return text
+
+
+class DigitStrip:
+    """One laid-out glyph per digit for a font, so counters are placed glyph by glyph instead of rasterised."""
+
+    def __init__(self, font: kn.Font):
+        self.glyphs = {digit: kn.Text(font) for digit in DIGITS}
+        for digit, glyph in self.glyphs.items():
+            glyph.text = digit
+        self.advances = {digit: glyph.width for digit, glyph in self.glyphs.items()}
+
+
+class Counter:
+    """An integer drawn from a DigitStrip; changing the value only re-places the glyphs."""
+
+    def __init__(self, strip: DigitStrip, value: int = 0):
+        self.strip = strip
+        self.value = None
+        self._glyphs: list[tuple[kn.Text, float]] = []
+        self.width = 0.0
+        self.set(value)
+
+    def set(self, value: int) -> bool:
+        """Returns whether the value changed."""
+        if value == self.value:
+            return False
+
+        self.value = value
+        self._glyphs.clear()
+        x = 0.0
+        for digit in str(value):
+            self._glyphs.append((self.strip.glyphs[digit], x))
+            x += self.strip.advances[digit]
+        self.width = x
+        return True
+
+    def draw(self, pos: kn.Vec2, layer: int) -> None:
+        queue = get_render_queue()
+        for glyph, x in self._glyphs:
+            queue.text(glyph, kn.Vec2(pos.x + x, pos.y), layer)
+
+
+_text_cache = TextCache()
+_digit_strips: dict[kn.Font, DigitStrip] = {}
+
+
+def get_text_cache() -> TextCache:
+    return _text_cache
+
+
+def get_digit_strip(font: kn.Font) -> DigitStrip:
+    strip = _digit_strips.get(font)
+    if strip is None:
+        strip = _digit_strips[font] = DigitStrip(font)
+    return strip
@@ -0,0 +1,187 @@
+from bisect import bisect_right, insort
+from collections.abc import Callable
+from heapq import merge
+from itertools import count
+from typing import Any
+
+import pykraken as kn
+
+
+Ease = Callable[[float], float]
+
+# Shared by every track, so events due at the same time fire in the order they were added across tracks
+_event_order = count()
+
+
+class Tween:
+    """Writes an eased value into target.attr while the timeline is inside [begin, begin + duration]."""
+
+    __slots__ = ("_from", "attr", "begin", "done", "duration", "ease", "end", "start", "target")
+
+    def __init__(
+        self,
+        target: Any,
+        attr: str,
+        start: float | None,
+        end: float,
+        begin: float,
+        duration: float,
+        ease: Ease = kn.ease.linear
+    ):
+        self.target = target
+        self.attr = attr
+        self.start = start      # None picks up whatever the attribute holds when the tween begins
+        self.end = end
+        self.begin = begin
+        self.duration = duration
+        self.ease = ease
+        self._from = start
+        self.done = False
+
+    @property
+    def finish(self) -> float:
+        return self.begin + self.duration
+
+    def rewind(self) -> None:
+        self._from = self.start
+        self.done = False
+
+    def apply(self, time: float) -> None:
+        if self._from is None:
+            self._from = getattr(self.target, self.attr)
+
+        progress = (time - self.begin) / self.duration if self.duration > 0 else 1.0
+        if progress >= 1.0:
+            progress = 1.0
+            self.done = True
+        setattr(self.target, self.attr, self._from + (self.end - self._from) * self.ease(progress))
+
+
+class Track:
+    """One lane of a timeline: events sorted by time, plus the tweens that play on it."""
+
+    __slots__ = ("_next", "events", "name", "order", "times", "tweens")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.times: list[float] = []
+        self.order: list[int] = []
+        self.events: list[Callable[[], None]] = []
+        self.tweens: list[Tween] = []
+        self._next = 0      # index of the first event that has not fired yet
+
+    def at(self, time: float, event: Callable[[], None]) -> None:
+        # Events at the same time fire in the order they were added
+        index = bisect_right(self.times, time)
+        self.times.insert(index, time)
+        self.order.insert(index, next(_event_order))
+        self.events.insert(index, event)
+
+    def tween(
+        self,
+        target: Any,
+        attr: str,
+        start: float | None,
+        end: float,
+        begin: float,
+        duration: float,
+        ease: Ease = kn.ease.linear
+    ) -> Tween:
+        tween = Tween(target, attr, start, end, begin, duration, ease)
+        insort(self.tweens, tween, key=lambda t: t.begin)
+        return tween
+
+    def retime(self, tween: Tween, begin: float) -> None:
+        """Move a tween to a new start; tweens are kept sorted by it, so it has to be re-inserted."""
+        self.tweens.remove(tween)
+        tween.begin = begin
+        insort(self.tweens, tween, key=lambda t: t.begin)
+
+    @property
+    def duration(self) -> float:
+        last_event = self.times[-1] if self.times else 0.0
+        return max([last_event] + [tween.finish for tween in self.tweens])
+
+    def rewind(self, time: float = 0.0) -> None:
+        self._next = bisect_right(self.times, time) if time > 0.0 else 0
+        for tween in self.tweens:
+            tween.rewind()
+
+    def due(self, time: float) -> list:
+        """Take every event up to and including `time` as (time, order, event); the split point is found by bisection."""
+        start, end = self._next, bisect_right(self.times, time)
+        if start >= end:
+            return []
+        self._next = end
+        return list(zip(self.times[start:end], self.order[start:end], self.events[start:end]))
+
+    def play(self, time: float) -> None:
+        for tween in self.tweens:
+            if tween.begin > time:
+                break
+            if not tween.done:
+                tween.apply(time)
+
+
+class Timeline:
+    """
+    Parallel tracks of timestamped events and tweens sharing one clock. Built once and
+    replayed with restart(); update() takes the delta so many timelines can share a driver.
+    """
+
+    __slots__ = ("_duration", "done", "paused", "speed", "time", "tracks")
+
+    def __init__(self):
+        self.tracks: dict[str, Track] = {}
+        self.time = 0.0
+        self.speed = 1.0
+        self.paused = False
+        self.done = True    # idle until restart()
+        self._duration = 0.0
+
+    def track(self, name: str) -> Track:
+        track = self.tracks.get(name)
+        if track is None:
+            track = self.tracks[name] = Track(name)
+        return track
+
+    @property
+    def duration(self) -> float:
+        return self._duration
+
+    def restart(self) -> None:
+        self._duration = max((track.duration for track in self.tracks.values()), default=0.0)
+        self.time = 0.0
+        self.paused = False
+        self.done = False
+        for track in self.tracks.values():
+            track.rewind()
+
+    def stop(self) -> None:
+        self.done = True
+
+    def seek(self, time: float) -> None:
+        """Jump without firing the events in between; tweens that have begun snap to the new time."""
+        self.time = max(0.0, min(time, self._duration))
+        for track in self.tracks.values():
+            track.rewind(self.time)
+            for tween in track.tweens:
+                if tween.begin < self.time:
+                    tween.apply(self.time)
+        self.done = self.time >= self._duration
+
+    def update(self, dt: float) -> None:
+        if self.done or self.paused:
+            return
+
+        self.time += dt * self.speed
+        if self.time >= self._duration:
+            self.time = self._duration
+            self.done = True
+
+        # A long step can pass events on several tracks; they fire in time order, not track by track
+        tracks = self.tracks.values()
+        for _, _, event in merge(*(track.due(self.time) for track in tracks)):
+            event()
+        for track in tracks:
+            track.play(self.time)
@@ -0,0 +1,159 @@
+import builtins
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+
+
+# MYTHIC_TRACE=startup.json records startup into that file (plus startup.json.txt).
+# The summary ends with counters sampled at the first frame, such as the resource cache totals.
+# With MYTHIC_TRACE_BUDGET_MS set, the game exits after the first frame: 0 within budget, 1 over.
+TRACE_ENV = "MYTHIC_TRACE"
+BUDGET_ENV = "MYTHIC_TRACE_BUDGET_MS"
+
+
+class StartupTracer:
+    """Nested wall-clock spans from launch to the first presented frame."""
+
+    def __init__(self, path: str, budget_ms: float | None = None):
+        self.path = path
+        self.budget_ms = budget_ms
+        self.origin = time.perf_counter_ns()
+        self.events: list[dict] = []
+        self._children: list[int] = []     # time spent in child spans, one entry per open span
+        self._import = builtins.__import__
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        self._children.append(0)
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += duration
+
+            self.events.append({
+                "name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": 0,
+                "ts": (start - self.origin) / 1000, "dur": duration / 1000,
+                "args": {**args, "self_ms": (duration - children) / 1e6},
+            })
+
+    def counter(self, name: str, **values) -> None:
+        self.events.append({
+            "name": name, "cat": "counter", "ph": "C", "pid": os.getpid(), "tid": 0,
+            "ts": (time.perf_counter_ns() - self.origin) / 1000, "args": values,
+        })
+
+    def install_import_hook(self) -> None:
+        original = self._import
+
+        def traced_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Only first imports cost anything; cached ones would just bury the trace in noise
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            with self.span(name, "import"):
+                return original(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = traced_import
+
+    def uninstall_import_hook(self) -> None:
+        builtins.__import__ = self._import
+
+    def finish(self) -> float:
+        self.uninstall_import_hook()
+        total_ms = (time.perf_counter_ns() - self.origin) / 1e6
+        self.events.append({
+            "name": "first frame", "cat": "startup", "ph": "i", "s": "g",
+            "pid": os.getpid(), "tid": 0, "ts": total_ms * 1000,
+        })
+
+        with open(self.path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+        summary = self.summary(total_ms)
+        with open(self.path + ".txt", "w") as f:
+            f.write(summary)
+        print(summary, end="")
+        return total_ms
+
+    def summary(self, total_ms: float) -> str:
+        spans = sorted((e for e in self.events if e["ph"] == "X"), key=lambda e: e["args"]["self_ms"], reverse=True)
+
+        lines = [f"startup to first frame: {total_ms:.1f} ms", f"{'self ms':>9} {'total ms':>9}  {'cat':<7} name"]
+        for event in spans:
+            detail = ""
+            if "bytes" in event["args"]:
+                detail = f"  ({event['args']['bytes'] / 1024:.0f} KiB)"
+            lines.append(
+                f"{event['args']['self_ms']:>9.2f} {event['dur'] / 1000:>9.2f}  {event['cat']:<7} {event['name']}{detail}"
+            )
+
+        for event in self.events:
+            if event["ph"] == "C":
+                values = ", ".join(f"{key} {value}" for key, value in event["args"].items())
+                lines.append(f"{event['name']}: {values}")
+
+        if self.budget_ms is not None:
+            verdict = "within" if total_ms <= self.budget_ms else "OVER"
+            lines.append(f"budget {self.budget_ms:.0f} ms: {verdict}")
+        return "\n".join(lines) + "\n"
+
+
+_tracer: StartupTracer | None = None
+
+
+def start_from_env() -> None:
+    global _tracer
+
+    path = os.environ.get(TRACE_ENV)
+    if not path or _tracer is not None:
+        return
+
+    budget = os.environ.get(BUDGET_ENV)
+    _tracer = StartupTracer(path, float(budget) if budget else None)
+    _tracer.install_import_hook()
+
+
+def is_active() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, cat: str = "startup", **args):
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.span(name, cat, **args)
+
+
+def asset_span(kind: str, path: str):
+    if _tracer is None:
+        return nullcontext()
+
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    return _tracer.span(path, "asset", kind=kind, bytes=size)
+
+
+def counter(name: str, **values) -> None:
+    if _tracer is not None:
+        _tracer.counter(name, **values)
+
+
+def finish_startup() -> bool | None:
+    """Write the trace once the first frame is up. Returns whether startup met the budget, if one is set."""
+    global _tracer
+
+    if _tracer is None:
+        return None
+
+    tracer, _tracer = _tracer, None
+    total_ms = tracer.finish()
+    if tracer.budget_ms is None:
+        return None
+    return total_ms <= tracer.budget_ms
@@ -1,6 +1,16 @@
+from core import trace
+trace.start_from_env()  # before any other import so those get timed too
+
+from functools import cached_property
+
 import pykraken as kn
+from core.clock import FixedStep, render_fps
 from core.constants import SCN_SIZE
 from core.deck import load_card_textures, load_fusion_table
+from core.idle import IdleFrame
+from core.profiler import get_profiler
+from core.render_queue import get_render_queue
+from core.resources import get_resources
 from states.base_state import BaseState
 from states.battle_state import BattleState
 from states.win_state import WinState
@@ -10,50 +20,135 @@ from core.enums import StateEnum
 from states.menu_state import MenuState
 
 
+TITLE_FONT = "assets/fonts/oldenglishtextmt.ttf"
+
+
 class Root:
     def __init__(self):
-        kn.init()
-
-        kn.window.create("Mythic Alchemy", SCN_SIZE)
-        kn.window.set_icon("assets/icon.png")
-        # kn.window.set_fullscreen(True)
-        kn.time.set_target(240)
-
-        load_card_textures()
-        load_fusion_table()
-
-        self.font = kn.Font("assets/fonts/oldenglishtextmt.ttf", 64)
-        self.font_sm = kn.Font("assets/fonts/oldenglishtextmt.ttf", 38)
-        self.font_lg = kn.Font("assets/fonts/oldenglishtextmt.ttf", 128)
-        self.font_rune = kn.Font("assets/fonts/RUNE.TTF", 96)
-
-        self.states: dict[StateEnum, BaseState] = {
-            StateEnum.MENU: MenuState(self),
-            StateEnum.BATTLE: BattleState(self),
-            StateEnum.WIN: WinState(self),
-            StateEnum.LOSE: LoseState(self),
-            StateEnum.STALE: StaleState(self),
+        with trace.span("kn.init"):
+            kn.init()
+
+        with trace.span("window"):
+            kn.window.create("Mythic Alchemy", SCN_SIZE)
+            kn.window.set_icon("assets/icon.png")
+            # kn.window.set_fullscreen(True)
+            kn.time.set_target(render_fps())
+
+        with trace.span("load_card_textures"):
+            load_card_textures()
+        with trace.span("load_fusion_table"):
+            load_fusion_table()
+
+        # A kn.Font is one file at one point size, so each size opens the file again. Setting pt_size
+        # on one shared font would resize every text drawn with it, so each size keeps its own handle.
+        resources = get_resources()
+        with trace.span("fonts"):
+            self.font = resources.font(TITLE_FONT, 64)
+            self.font_sm = resources.font(TITLE_FONT, 38)
+            self.font_rune = resources.font("assets/fonts/RUNE.TTF", 96)
+
+        # Result screens are only built the first time a match ends that way
+        self._state_types: dict[StateEnum, type[BaseState]] = {
+            StateEnum.MENU: MenuState,
+            StateEnum.BATTLE: BattleState,
+            StateEnum.WIN: WinState,
+            StateEnum.LOSE: LoseState,
+            StateEnum.STALE: StaleState,
         }
+        self.states: dict[StateEnum, BaseState] = {}
+        self.get_state(StateEnum.MENU)
+        self.get_state(StateEnum.BATTLE)
         self.current_state = StateEnum.MENU
 
-        self.theme_music = kn.AudioStream("assets/audio/theme.wav", volume=0.3)
+        with trace.asset_span("stream", "assets/audio/theme.wav"):
+            self.theme_music = kn.AudioStream("assets/audio/theme.wav", volume=0.3)
         self.theme_music.play(fade_in_ms=2000, loop=True)
 
-    def _make_battle_state(self) -> BattleState:
-        return BattleState(self)
+    @cached_property
+    def font_lg(self) -> kn.Font:
+        # Only the result screens' titles use it, so it is opened with the first of them
+        return get_resources().font(TITLE_FONT, 128)
+
+    def get_state(self, key: StateEnum) -> BaseState:
+        state = self.states.get(key)
+        if state is None:
+            state_type = self._state_types[key]
+            with trace.span(state_type.__name__, "state"):
+                state = self.states[key] = state_type(self)
+        return state
+
+    def start_battle(self, seed: int | None = None) -> None:
+        self.states[StateEnum.BATTLE].start(seed)
+        self.current_state = StateEnum.BATTLE
+
+    def shutdown(self) -> None:
+        # The bot's worker process is started by the first battle and must not outlive the window
+        self.states[StateEnum.BATTLE].bot_worker.close()
+
+        # Hand every screen's textures and sounds back to the cache while the renderer still exists
+        for state in self.states.values():
+            state.release_resources()
 
     def __del__(self):
         kn.quit()
 
     def run(self):
+        profiler = get_profiler()
+        render_queue = get_render_queue()
+        clock = FixedStep()
+        idle = IdleFrame()
+
         while kn.window.is_open():
-            state = self.states[self.current_state]
+            profiler.begin_frame()
+            state = self.get_state(self.current_state)
+
+            with profiler.scope("events"):
+                events = kn.event.poll()
+                for event in events:
+                    profiler.handle_event(event)
+                    state.handle_event(event)
+
+            # Static screens with nothing new to show skip the frame and sleep until input arrives
+            parked = state.static and not profiler.overlay
+            if parked and not events and idle.valid_for(state):
+                idle.wait()
+                continue
+
+            with profiler.scope("tick"):
+                for _ in range(clock.advance(kn.time.get_delta())):
+                    state.tick(clock.dt)
+
+            with profiler.scope("update"):
+                redraw = not parked or not idle.valid_for(state) or state.hover_changed()
+                state.update(clock.alpha)
+
+            profiler.draw_overlay()
+            with profiler.scope("present"):
+                if redraw:
+                    render_queue.flush()
+                    if parked and self.states[self.current_state] is state:
+                        idle.capture(state)
+                else:
+                    # Input was handled, but the screen looks the same as the cached frame
+                    render_queue.discard()
+                    idle.draw()
+                kn.renderer.present()
+            profiler.end_frame()
+
+            if self.states.get(self.current_state) is not state:
+                idle.invalidate()
 
-            for event in kn.event.poll():
-                state.handle_event(event)
+            if trace.is_active():
+                trace.counter("resources", **get_resources().stats())
+                within_budget = trace.finish_startup()
+                if within_budget is not None:
+                    # Benchmark run: stop after the first frame and report through the exit code
+                    kn.window.close()
+                    self.shutdown()
+                    raise SystemExit(0 if within_budget else 1)
 
-            state.update()
-            kn.renderer.present()
+        self.shutdown()
+        profiler.dump_csv()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+import argparse
+import time
+
+from core.replay import load_replay, run_replay
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-run recorded matches without a window and check their final state.")
+    parser.add_argument("paths", nargs="+", metavar="REPLAY", help="replay logs written by the game")
+    args = parser.parse_args()
+
+    failed = 0
+    total = 0.0
+    for path in args.paths:
+        replay = load_replay(path)
+
+        start = time.perf_counter()
+        engine, matched = run_replay(replay)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+
+        failed += not matched
+        print(
+            f"{path}: seed {replay.seed}, {len(replay.actions)} actions, {engine.rounds} rounds, "
+            f"{engine.outcome.name.lower()} in {elapsed * 1000:.1f}ms -> {'ok' if matched else 'HASH MISMATCH'}"
+        )
+
+    if len(args.paths) > 1:
+        print(f"{len(args.paths)} replays in {total:.2f}s, {failed} mismatched")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
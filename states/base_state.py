@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Any
+import pykraken as kn
 from pykraken import Event
+from core.hit_index import HitIndex
+from core.resources import get_resources
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -7,15 +11,46 @@ if TYPE_CHECKING:
 
 
 class BaseState(ABC):
+    # Screens that only change on input; Root parks them on a cached frame between events
+    static = False
+
     def __init__(self, root: "Root") -> None:
         super().__init__()
 
         self.root = root
+        self._held: list[Any] = []
+
+        # Everything clickable on this screen, resolved with one pick per mouse position
+        self.hit_index = HitIndex()
+
+    def load_texture(self, path: str) -> kn.Texture:
+        return self._hold(get_resources().texture(path))
+
+    def load_audio(self, path: str, volume: float = 1.0) -> kn.Audio:
+        return self._hold(get_resources().audio(path, volume))
+
+    def release_resources(self) -> None:
+        resources = get_resources()
+        for handle in self._held:
+            resources.release(handle)
+        self._held.clear()
+
+    def _hold(self, handle: Any) -> Any:
+        self._held.append(handle)
+        return handle
 
     @abstractmethod
     def handle_event(self, event: Event) -> None:
         pass
 
+    def hover_changed(self) -> bool:
+        return False
+
+    # Game logic and animation, one fixed step at a time; static screens have none
+    def tick(self, dt: float) -> None:
+        pass
+
+    # Input and drawing once per frame, `alpha` of the way from the last tick to the next
     @abstractmethod
-    def update(self) -> None:
+    def update(self, alpha: float) -> None:
         pass
@@ -1,16 +1,24 @@
 import math
 import pykraken as kn
-from core.card import Card, CardLocation
+from core.card import Card
+from core.card_motion import get_card_motion
 from core.constants import CARD_SIZE, SCN_SIZE
-from core.deck import get_card_texture
+from core.deck import draw_card, get_fusion_recipes
+from core.profiler import get_profiler
+from core.layer_cache import LayerCache
+from core.render_queue import get_render_queue, LAYER_BACKGROUND, LAYER_BUTTON, LAYER_PLAYED
+from core.engine import MatchEngine, PlayAction, STARTING_HEALTH
 from states.base_state import BaseState
 from core.player import Player
 from core.bot import Bot
 from core.fusion_table import FusionTable
 from core.button import Button
-from core.sequencer import Sequencer
+from core.replay import ActionKind, LHS, RHS, ReplayRecorder, match_streams, new_seed, replay_path, state_hash
+from core.bot_worker import BotWorker
+from core.round_timing import ROUND_TIMES, BOT_COLLECT_BY, EXIT_DURATION, SHAKE_DURATION, TRAVEL_DURATION
 from core.stats import Stats
-from core.enums import StateEnum
+from core.timeline import Timeline
+from core.enums import StateEnum, MatchOutcome
 
 from typing import TYPE_CHECKING, override
 if TYPE_CHECKING:
@@ -21,111 +29,154 @@ class BattleState(BaseState):
     def __init__(self, root: "Root"):
         super().__init__(root)
 
-        self.player = Player()
+        self.player = Player(self.hit_index)
         self.bot = Bot()
 
-        self.player_stats = Stats(
-            root.font, root.font_sm,
-            self.player.health,
-            len(self.player.deck) + len(self.player.hand),
-            "You"
-        )
-        self.bot_stats = Stats(
-            root.font, root.font_sm,
-            self.bot.health,
-            len(self.bot.deck),
-            "Bot"
-        )
+        self.player_stats = Stats(root.font, root.font_sm, STARTING_HEALTH, 0, "You")
+        self.bot_stats = Stats(root.font, root.font_sm, STARTING_HEALTH, 0, "Bot")
 
-        self.background_tex = kn.Texture("assets/background.png")
-        self.fusion_table = FusionTable()
+        self.background_tex = self.load_texture("assets/background.png")
+        self.background_rect = self.background_tex.get_rect()
+        self.fusion_table = FusionTable(self.hit_index)
 
-        self.dragged_card: Card | None = None
+        # Background and both stat panels, recomposed only when a number changes
+        self.hud = LayerCache(LAYER_BUTTON)
+
+        self.play_btn = Button(root.font, "Play", self.hit_index)
+
+        # The bot thinks in another process during the player's turn; the round collects its pick
+        self.bot_worker = BotWorker()
+
+        # Shake / attack resolution (sequential: player then bot)
+        self.travel_duration = TRAVEL_DURATION
+        self.exit_duration = EXIT_DURATION
+        self.shake_duration = SHAKE_DURATION
+        self.shake_amp = 6.0
+        self.shake_freq = 18.0
+
+        # SFX
+        self.card_place_sfx = self.load_audio("assets/audio/card_place.wav", volume=0.5)
+        self.play_card_sfx = self.load_audio("assets/audio/play_card.wav", volume=0.2)
+        self.card_attack_sfx = self.load_audio("assets/audio/card_attack.wav", volume=0.2)
+        self.victory_sfx = self.load_audio("assets/audio/victory.wav", volume=0.3)
+        self.lose_sfx = self.load_audio("assets/audio/lose.wav", volume=0.3)
+
+        # Player card moves result -> lhs slot; bot card flies in from the right -> result slot
+        self.played_rect = kn.Rect(0, 0, CARD_SIZE)
+        self.bot_play_rect = kn.Rect(0, 0, CARD_SIZE)
+        self.played_dst = kn.Rect(0, 0, CARD_SIZE)
+        self.bot_play_dst = kn.Rect(0, 0, CARD_SIZE)
+
+        # The round choreography is built once and replayed by every play
+        self.battle_timeline = self._build_battle_timeline()
+
+        self.reset()
+
+    def reset(self, seed: int | None = None) -> None:
+        """Start a fresh match in place, keeping every texture, sound and animation object."""
+        if seed is None:
+            seed = new_seed()
+        streams = match_streams(seed)
+
+        # Everything the player does is logged against the tick it landed on, for replay
+        self.ticks = 0
+        self.recorder = ReplayRecorder(seed)
 
-        play_txt = kn.Text(root.font)
-        play_txt.text = "Play"
-        self.play_btn = Button(play_txt)
+        get_card_motion().clear()
+        self.player.reset(streams.player_deck)
+        self.bot.reset(streams.bot_deck)
+        self.engine = MatchEngine(self.player, self.bot, get_fusion_recipes(), streams.bot, self.bot_worker)
+        for card in self.engine.deal():
+            card.begin_hand_entry()
+
+        self.player_stats.reset(self.player.health, len(self.player.deck) + len(self.player.hand))
+        self.bot_stats.reset(self.bot.health, len(self.bot.deck))
+        self.fusion_table.reset()
+
+        self.dragged_card: Card | None = None
+        self.drag_origin: int | None = None    # slot the dragged card was lifted from
 
         self.battling = False
-        self.battle_sequencer = Sequencer([
-            {"name": [
-                self.fusion_table.hide,
-            ], "duration": 0.8},
-        ])
+        self.bot_pending = False    # played, but the bot's card has not been drawn yet
 
         self.played_card: Card | None = None
         self.bot_played_card: Card | None = None
 
-        # Animation state for player card moving result -> lhs slot
-        self.play_anim = kn.EasingAnimation(kn.ease.out_cubic, 0.65)
-        self.play_start = kn.Vec2()
-        self.play_end = kn.Vec2()
-        self.played_rect = kn.Rect(0, 0, CARD_SIZE)
+        # Seconds into each card's shake; resting at the full duration means no offset
+        self.player_shake = self.shake_duration
+        self.bot_shake = self.shake_duration
+        self._snapshot_play()
 
-        # Animation state for bot card flying in from the right -> result slot
-        self.bot_anim = kn.EasingAnimation(kn.ease.out_cubic, 0.65)
-        self.bot_start = kn.Vec2()
-        self.bot_end = kn.Vec2()
-        self.bot_play_rect = kn.Rect(0, 0, CARD_SIZE)
+    def start(self, seed: int | None = None) -> None:
+        """Reset for a new match and let the bot start on its first decision."""
+        self.reset(seed)
+        self.bot_worker.submit(self.engine)
 
-        # Shake / attack resolution (sequential: player then bot)
-        self.shake_phase: str = "idle"   # idle -> player -> bot -> done
-        self.shake_elapsed = 0.0
-        self.shake_duration = 0.35
-        self.shake_gap_duration = 0.35
-        self.shake_amp = 6.0
-        self.shake_freq = 18.0
-        self.player_attack_done = False
-        self.bot_attack_done = False
-        self.cards_used_count = 0
+    def _build_battle_timeline(self) -> Timeline:
+        player_shake_at, bot_shake_at, exit_at, show_at, finish_at = ROUND_TIMES
+
+        timeline = Timeline()
 
-        self.table_show_duration = 0.8
+        table = timeline.track("table")
+        table.at(0.0, self.fusion_table.hide)
+        table.at(show_at, self._show_table)
+        table.at(finish_at, self._finish_round)
 
-        # Exit animations: slide player card left, bot card right
-        self.play_exit_anim = kn.EasingAnimation(kn.ease.in_cubic, 0.55)
-        self.play_exit_active = False
-        self.play_exit_end = kn.Vec2()
+        # Travel targets depend on the slot positions, so play_card fills in their ends
+        player = timeline.track("player")
+        self.play_travel = player.tween(
+            self.played_rect, "x", None, 0.0, 0.0, self.travel_duration, kn.ease.out_cubic
+        )
+        player.at(player_shake_at, self._resolve_player_attack)
+        player.tween(self, "player_shake", 0.0, self.shake_duration, player_shake_at, self.shake_duration)
+        player.tween(
+            self.played_rect, "x", None, -CARD_SIZE.x * 1.5, exit_at, self.exit_duration, kn.ease.in_cubic
+        )
 
-        self.bot_exit_anim = kn.EasingAnimation(kn.ease.in_cubic, 0.55)
-        self.bot_exit_active = False
-        self.bot_exit_end = kn.Vec2()
+        bot = self.bot_track = timeline.track("bot")
+        self.bot_travel = bot.tween(
+            self.bot_play_rect, "x", None, 0.0, 0.0, self.travel_duration, kn.ease.out_cubic
+        )
+        bot.at(bot_shake_at, self._resolve_bot_attack)
+        bot.tween(self, "bot_shake", 0.0, self.shake_duration, bot_shake_at, self.shake_duration)
+        bot.tween(
+            self.bot_play_rect, "x", None, SCN_SIZE.x + CARD_SIZE.x * 1.5, exit_at, self.exit_duration,
+            kn.ease.in_cubic
+        )
 
-        # SFX
-        self.card_place_sfx = kn.Audio("assets/audio/card_place.wav", volume=0.5)
-        self.play_card_sfx = kn.Audio("assets/audio/play_card.wav", volume=0.2)
-        self.card_attack_sfx = kn.Audio("assets/audio/card_attack.wav", volume=0.2)
-        self.victory_sfx = kn.Audio("assets/audio/victory.wav", volume=0.3)
-        self.lose_sfx = kn.Audio("assets/audio/lose.wav", volume=0.3)
+        return timeline
+
+    @override
+    def release_resources(self) -> None:
+        super().release_resources()
+        self.fusion_table.release()
 
     @override
     def handle_event(self, event: kn.Event) -> None:
         if event.type == kn.MOUSE_BUTTON_DOWN and event.button == kn.M_LEFT:
-            mouse_pos = kn.mouse.get_pos()
-            for card in self.player.hand:
-                if card.location is not CardLocation.HAND:
-                    continue
-
-                if card.contains_point(mouse_pos):
-                    card.start_drag()
-                    self.dragged_card = card
-                    return
+            target = self.hit_index.pick(kn.mouse.get_pos())
+
+            # Only cards resting in the hand are registered, so any card hit can be picked up
+            if isinstance(target, Card):
+                target.start_drag()
+                self.dragged_card = target
+                self.drag_origin = None
+                return
 
             # Check lhs fusion slot
-            if (kn.collision.overlap(self.fusion_table.lhs_rect, mouse_pos)
-                and self.fusion_table.lhs_card is not None
-                ):
+            if target is self.fusion_table.lhs_rect and self.fusion_table.lhs_card is not None:
                 self.dragged_card = self.fusion_table.lhs_card
                 self.dragged_card.start_drag()
-                self.fusion_table.lhs_card = None
+                self.fusion_table.set_lhs(None)
+                self.drag_origin = LHS
                 return
 
             # Check rhs fusion slot
-            if (kn.collision.overlap(self.fusion_table.rhs_rect, mouse_pos)
-                and self.fusion_table.rhs_card is not None
-                ):
+            if target is self.fusion_table.rhs_rect and self.fusion_table.rhs_card is not None:
                 self.dragged_card = self.fusion_table.rhs_card
                 self.dragged_card.start_drag()
-                self.fusion_table.rhs_card = None
+                self.fusion_table.set_rhs(None)
+                self.drag_origin = RHS
                 return
 
         elif event.type == kn.MOUSE_BUTTON_UP and event.button == kn.M_LEFT:
@@ -145,241 +196,180 @@ class BattleState(BaseState):
                 dx_rhs = dropped_card_rect.x - self.fusion_table.rhs_rect.x
 
                 if abs(dx_lhs) < abs(dx_rhs):
+                    self._record(ActionKind.PLACE, self.player.hand.index(self.dragged_card), LHS)
                     if self.fusion_table.lhs_card is not None:
                         self.fusion_table.lhs_card.return_to_hand()
                     self.dragged_card.place_in_slot(self.fusion_table.lhs_rect)
-                    self.fusion_table.lhs_card = self.dragged_card
+                    self.fusion_table.set_lhs(self.dragged_card)
                     self.dragged_card = None
                     return
 
+                self._record(ActionKind.PLACE, self.player.hand.index(self.dragged_card), RHS)
                 if self.fusion_table.rhs_card is not None:
                     self.fusion_table.rhs_card.return_to_hand()
 
                 self.dragged_card.place_in_slot(self.fusion_table.rhs_rect)
-                self.fusion_table.rhs_card = self.dragged_card
+                self.fusion_table.set_rhs(self.dragged_card)
                 self.dragged_card = None
                 return
 
+            if self.drag_origin is not None:
+                self._record(ActionKind.UNSLOT, slot=self.drag_origin)
             self.dragged_card.return_to_hand()
             self.dragged_card = None
 
+    def _record(self, kind: ActionKind, card: int = 0, slot: int = 0) -> None:
+        self.recorder.record(self.ticks, kind, card, slot)
+
     @override
-    def update(self) -> None:
+    def tick(self, dt: float) -> None:
+        self.ticks += 1
+        if self.bot_pending:
+            self._collect_bot_card(self.battle_timeline.time >= BOT_COLLECT_BY)
+        self._snapshot_play()
+        if self.battling:
+            self.battle_timeline.update(dt)
+            if self.battle_timeline.done:
+                self.battling = False
+
+        self.fusion_table.update(dt)
+        get_card_motion().step(dt)
+
+    @override
+    def update(self, alpha: float) -> None:
         if self.play_btn.is_clicked() and not self.battling:
             self.play_card()
 
-        if self.battling:
-            self.battle_sequencer.update()
-            if self.battle_sequencer.done:
-                self.battling = False
+        profiler = get_profiler()
 
-        kn.renderer.draw(self.background_tex, anchor=kn.Anchor.TOP_LEFT)
+        with profiler.scope("stats"):
+            if self.hud.ready and not (self.player_stats.dirty or self.bot_stats.dirty):
+                self.hud.draw()
+            else:
+                self._compose_hud()
+
+        with profiler.scope("fusion_table"):
+            self.fusion_table.render(alpha)
+        self.play_btn.draw(self.fusion_table.draw_rect.top_mid, kn.Anchor.BOTTOM_MID)
+        with profiler.scope("play_sequence"):
+            self._render_play_sequence(alpha)
+        with profiler.scope("hand"):
+            self.player.render_hand(alpha)
+
+    def _compose_hud(self) -> None:
+        get_render_queue().texture(self.background_tex, self.background_rect, LAYER_BACKGROUND)
         self.player_stats.render(kn.Vec2(20, 20), kn.Anchor.TOP_LEFT)
         self.bot_stats.render(kn.Vec2(kn.renderer.get_res().x - 20, 20), kn.Anchor.TOP_RIGHT)
-
-        self.play_btn.draw(self.fusion_table.table_rect.top_mid, kn.Anchor.BOTTOM_MID)
-        self.fusion_table.render()
-        self._render_play_sequence()
-        self.player.render_hand()
+        self.hud.rebuild()
+        self.player_stats.dirty = False
+        self.bot_stats.dirty = False
 
     def play_card(self) -> None:
-        self.played_card = self.fusion_table.fusion_result_card
-        if self.played_card is None:
+        if self.fusion_table.fusion_result_card is None:
             return
 
         self.play_card_sfx.play()
+        self._record(ActionKind.PLAY)
 
-        self.battle_sequencer.reset()
-        self.battling = True
+        # Player card starts on the fusion result and travels to the lhs slot
+        result_rect = self.fusion_table.fusion_result_rect
+        self.played_rect.top_left = result_rect.top_left
+        self.play_travel.end = self.fusion_table.lhs_rect.x
 
-        # Player animation: move the fusion result to the lhs slot
-        self.play_start = kn.Vec2(
-            self.fusion_table.fusion_result_rect.top_left.x,
-            self.fusion_table.fusion_result_rect.top_left.y
-        )
-        self.play_end = kn.Vec2(
-            self.fusion_table.lhs_rect.top_left.x,
-            self.fusion_table.lhs_rect.top_left.y
-        )
-        self.play_anim.start_pos = self.play_start
-        self.play_anim.end_pos = self.play_end
-        self.play_anim.restart()
-        self.played_rect.top_left = self.play_start
+        # Commit the play to the rules engine; the bot's card follows once its worker answers
+        played_from = (self.fusion_table.lhs_card, self.fusion_table.rhs_card)
+        self.played_card = self.engine.begin_round(PlayAction(*played_from), draw_bot=False)
+        self.fusion_table.clear()
+        for card in played_from:
+            if card is not None:
+                card.release_render_state()
 
-        # Bot draws and animates its card from the right edge toward the fusion result slot
-        self.bot_played_card = self.bot.draw_card()
-        if self.bot_played_card is not None:
-            self.bot_start = kn.Vec2(SCN_SIZE.x + CARD_SIZE.x, self.fusion_table.fusion_result_rect.top_left.y)
-            self.bot_end = kn.Vec2(
-                self.fusion_table.fusion_result_rect.top_left.x,
-                self.fusion_table.fusion_result_rect.top_left.y
-            )
-            self.bot_anim.start_pos = self.bot_start
-            self.bot_anim.end_pos = self.bot_end
-            self.bot_anim.restart()
-            self.bot_play_rect.top_left = self.bot_start
-            self.bot_stats.set_deck_size(len(self.bot.deck))
-
-        # Reset shake state for this battle resolution
-        self.shake_phase = "idle"
-        self.shake_elapsed = 0.0
-        self.player_attack_done = False
-        self.bot_attack_done = False
-        self.cards_used_count = 0
-
-        # Reset exit state
-        self.play_exit_active = False
-        self.bot_exit_active = False
-
-        # Build a per-round sequencer timeline
-        travel_duration = 0.65
-        exit_duration = 0.55
-        self.battle_sequencer = Sequencer([
-            {"name": [self._seq_start_travel], "duration": travel_duration},
-            {"name": [self._seq_start_player_shake], "duration": self.shake_duration},
-            {"name": [self._seq_start_gap], "duration": self.shake_gap_duration},
-            {"name": [self._seq_start_bot_shake], "duration": self.shake_duration},
-            {"name": [self._seq_start_exit], "duration": exit_duration},
-            {"name": [self._seq_show_table], "duration": self.table_show_duration},
-            {"name": [self._seq_finish_round], "duration": 0.0},
-        ])
-        self.battling = True
-
-        if self.fusion_table.lhs_card is not None:
-            self.cards_used_count += 1
-            self.player.hand.remove(self.fusion_table.lhs_card)
-            self.fusion_table.lhs_card = None
-        if self.fusion_table.rhs_card is not None:
-            self.cards_used_count += 1
-            self.player.hand.remove(self.fusion_table.rhs_card)
-            self.fusion_table.rhs_card = None
-
-    def _render_play_sequence(self) -> None:
-        dt = kn.time.get_delta()
-
-        # Player card animation: fusion result slot -> lhs slot
-        if not self.play_anim.is_done and self.played_card is not None:
-            pos = self.play_anim.step()
-            self.played_rect.top_left = pos
-        elif self.play_exit_active and not self.play_exit_anim.is_done and self.played_card is not None:
-            pos = self.play_exit_anim.step()
-            self.played_rect.top_left = pos
-        elif self.play_exit_active and self.play_exit_anim.is_done and self.played_card is not None:
-            self.played_rect.top_left = self.play_exit_end
-        elif self.played_card is not None:
-            self.played_rect.top_left = self.play_end
+        self.bot_played_card = None
+        self.bot.played_card = None
+        self.bot_play_rect.top_left = kn.Vec2(SCN_SIZE.x + CARD_SIZE.x, result_rect.y)
+        self.bot_travel.end = result_rect.x
+        self.bot_pending = bool(self.bot.deck)
 
-        if self.played_card is not None:
-            dst = kn.Rect(self.played_rect.x, self.played_rect.y, self.played_rect.size)
-            dst.top_left = self._shake_offset(dst.top_left, owner="player")
-            kn.renderer.draw(get_card_texture(self.played_card.ID), dst=dst)
+        self.player_shake = self.shake_duration
+        self.bot_shake = self.shake_duration
 
-        # Bot card animation: right edge -> fusion result slot
-        if self.bot_played_card is not None:
-            if not self.bot_anim.is_done:
-                pos = self.bot_anim.step()
-                self.bot_play_rect.top_left = pos
-            elif self.bot_exit_active and not self.bot_exit_anim.is_done:
-                pos = self.bot_exit_anim.step()
-                self.bot_play_rect.top_left = pos
-            elif self.bot_exit_active and self.bot_exit_anim.is_done:
-                self.bot_play_rect.top_left = self.bot_exit_end
-            else:
-                self.bot_play_rect.top_left = self.bot_end
-
-            dst = kn.Rect(self.bot_play_rect.x, self.bot_play_rect.y, self.bot_play_rect.size)
-            dst.top_left = self._shake_offset(dst.top_left, owner="bot")
-            kn.renderer.draw(get_card_texture(self.bot_played_card.ID), dst=dst)
-
-            if self.bot_anim.is_done:
-                # Keep the bot's resting play rect aligned to the result slot
-                self.bot.play_rect.top_left = self.bot_end
-        # Advance shake timer (phase transitions are driven by sequencer callbacks)
-        self._advance_shake_time(dt)
-
-    def _shake_offset(self, base: kn.Vec2, owner: str) -> kn.Vec2:
-        if self.shake_phase != owner:
-            return base
-
-        phase = self.shake_elapsed * self.shake_freq * (2.0 * math.pi)
-        falloff = max(0.0, 1.0 - min(1.0, self.shake_elapsed / self.shake_duration))
-        dx = math.sin(phase) * self.shake_amp * falloff
-        dy = math.sin(phase * 0.7 + 1.3) * self.shake_amp * falloff
-        return base + kn.Vec2(dx, dy)
-
-    def _advance_shake_time(self, dt: float) -> None:
-        if self.shake_phase not in ("player", "bot"):
+        self.battle_timeline.restart()
+        self.battling = True
+        if self.bot_pending:
+            self._collect_bot_card(False)
+        self._snapshot_play()
+
+    def _collect_bot_card(self, force: bool) -> None:
+        # Until the deadline only a finished worker is taken; at it the worker's greedy fallback
+        # picks instead, so the frame never runs a search
+        if not force and not self.bot_worker.ready():
             return
-        self.shake_elapsed += dt
-
-    def _start_shake_phase(self, phase: str) -> None:
-        self.shake_phase = phase
-        self.shake_elapsed = 0.0
-
-        if phase == "player" and not self.player_attack_done and self.played_card and self.bot_played_card:
-            dmg_to_bot = max(0, self.played_card.attack - self.bot_played_card.defense)
-            self.bot.health -= dmg_to_bot
-            self.bot_stats.set_health(self.bot.health)
-            self.player_attack_done = True
-        elif phase == "bot" and not self.bot_attack_done and self.played_card and self.bot_played_card:
-            dmg_to_player = max(0, self.bot_played_card.attack - self.played_card.defense)
-            self.player.health -= dmg_to_player
-            self.player_stats.set_health(self.player.health)
-            self.bot_attack_done = True
 
-        self.card_attack_sfx.play()
+        self.bot_pending = False
+        self.bot_played_card = self.engine.draw_bot_card()
+        self.bot.played_card = self.bot_played_card
 
-    # Sequencer callbacks
-    def _seq_start_travel(self) -> None:
-        # Animations already configured in play_card; just ensure we restart
-        self.play_anim.restart()
-        self.bot_anim.restart()
-        self.fusion_table.hide()
+        # The search depends on the machine's speed, so its pick is logged rather than re-run
+        self._record(ActionKind.BOT, self.engine.bot_choice + 1)
+        self.bot_stats.set_deck_size(len(self.bot.deck))
 
-    def _seq_start_player_shake(self) -> None:
-        self._start_shake_phase("player")
+        # Bot animates its card from the right edge toward the fusion result slot, landing with the player's
+        start = self.battle_timeline.time
+        self.bot_play_rect.x = SCN_SIZE.x + CARD_SIZE.x
+        self.bot_track.retime(self.bot_travel, start)
+        self.bot_travel.duration = self.travel_duration - start
+        self.bot_travel.rewind()
 
-    def _seq_start_gap(self) -> None:
-        self.shake_phase = "gap"
-        self.shake_elapsed = 0.0
+    def _snapshot_play(self) -> None:
+        # Tweened values as of the last tick, so frames in between can blend toward the current ones
+        self._prev_play = (self.played_rect.x, self.bot_play_rect.x, self.player_shake, self.bot_shake)
 
-    def _seq_start_bot_shake(self) -> None:
-        self._start_shake_phase("bot")
+    def _render_play_sequence(self, alpha: float) -> None:
+        played_x, bot_x, player_shake, bot_shake = self._prev_play
 
-    def _seq_start_exit(self) -> None:
-        # Player exits left
         if self.played_card is not None:
-            self.play_exit_active = True
-            self.play_exit_anim.start_pos = kn.Vec2(self.played_rect.top_left.x, self.played_rect.top_left.y)
-            self.play_exit_end = kn.Vec2(-CARD_SIZE.x * 1.5, self.played_rect.top_left.y)
-            self.play_exit_anim.end_pos = self.play_exit_end
-            self.play_exit_anim.restart()
+            x = played_x + (self.played_rect.x - played_x) * alpha
+            shake = player_shake + (self.player_shake - player_shake) * alpha
+            self._shake_into(self.played_dst, x, self.played_rect.y, shake)
+            draw_card(self.played_card.ID, self.played_dst, LAYER_PLAYED)
 
-        # Bot exits right
         if self.bot_played_card is not None:
-            self.bot_exit_active = True
-            self.bot_exit_anim.start_pos = kn.Vec2(self.bot_play_rect.top_left.x, self.bot_play_rect.top_left.y)
-            self.bot_exit_end = kn.Vec2(SCN_SIZE.x + CARD_SIZE.x * 1.5, self.bot_play_rect.top_left.y)
-            self.bot_exit_anim.end_pos = self.bot_exit_end
-            self.bot_exit_anim.restart()
+            x = bot_x + (self.bot_play_rect.x - bot_x) * alpha
+            shake = bot_shake + (self.bot_shake - bot_shake) * alpha
+            self._shake_into(self.bot_play_dst, x, self.bot_play_rect.y, shake)
+            draw_card(self.bot_played_card.ID, self.bot_play_dst, LAYER_PLAYED)
+
+    def _shake_into(self, dst: kn.Rect, x: float, y: float, elapsed: float) -> None:
+        dst.x, dst.y = x, y
+        if elapsed >= self.shake_duration:
+            return
+
+        phase = elapsed * self.shake_freq * (2.0 * math.pi)
+        falloff = 1.0 - elapsed / self.shake_duration
+        dst.x += math.sin(phase) * self.shake_amp * falloff
+        dst.y += math.sin(phase * 0.7 + 1.3) * self.shake_amp * falloff
+
+    # Timeline events
+    def _resolve_player_attack(self) -> None:
+        self.engine.resolve_player_attack()
+        self.bot_stats.set_health(self.bot.health)
+        self.card_attack_sfx.play()
+
+    def _resolve_bot_attack(self) -> None:
+        self.engine.resolve_bot_attack()
+        self.player_stats.set_health(self.player.health)
+        self.card_attack_sfx.play()
 
-    def _seq_show_table(self) -> None:
+    def _show_table(self) -> None:
         self.fusion_table.show()
 
         # Refill hands while the table returns
-        draws = max(1, min(2, self.cards_used_count)) if self.cards_used_count > 0 else 0
-        for _ in range(draws):
-            self.player.draw_card()
+        for card in self.engine.refill():
+            card.begin_hand_entry()
         self.player_stats.set_deck_size(len(self.player.deck) + len(self.player.hand))
 
-    def _seq_finish_round(self) -> None:
-        self.shake_phase = "done"
-
-        # Remove played cards from hands
-        if self.played_card is not None and self.played_card in self.player.hand:
-            self.player.hand.remove(self.played_card)
-        if self.bot_played_card is not None and self.bot_played_card in self.bot.hand:
-            self.bot.hand.remove(self.bot_played_card)
+    def _finish_round(self) -> None:
+        outcome = self.engine.finish_round()
 
         # Clear references to prevent stale rendering
         self.played_card = None
@@ -390,24 +380,20 @@ class BattleState(BaseState):
         self.bot_stats.set_deck_size(len(self.bot.deck))
 
         # Transition checks
-        if self.player.health <= 0 and self.bot.health <= 0:
-            self.root.theme_music.pause()
-            self.root.current_state = StateEnum.STALE
+        if outcome is MatchOutcome.ONGOING:
+            self.bot_worker.submit(self.engine)
             return
 
-        if self.player.health <= 0:
-            self.root.theme_music.pause()
+        path = replay_path()
+        if path:
+            self.recorder.save(path, state_hash(self.engine))
+
+        self.root.theme_music.pause()
+        if outcome is MatchOutcome.LOSE:
             self.lose_sfx.play()
             self.root.current_state = StateEnum.LOSE
-            return
-        if self.bot.health <= 0:
-            self.root.theme_music.pause()
+        elif outcome is MatchOutcome.WIN:
             self.victory_sfx.play()
             self.root.current_state = StateEnum.WIN
-            return
-
-        player_cards_left = len(self.player.deck) + len(self.player.hand)
-        bot_cards_left = len(self.bot.deck) + len(self.bot.hand)
-        if player_cards_left == 0 or bot_cards_left == 0:
-            self.root.theme_music.pause()
+        else:
             self.root.current_state = StateEnum.STALE
@@ -1,6 +1,6 @@
 import pykraken as kn
-from core.enums import StateEnum
 from states.base_state import BaseState
+from core.render_queue import get_render_queue, LAYER_BACKGROUND, LAYER_HUD_TEXT
 from core.button import Button
 from core.constants import SCN_SIZE
 
@@ -15,10 +15,13 @@ QUIT_OFFSET = kn.Vec2(0, 180)
 
 
 class MenuState(BaseState):
+    static = True
+
     def __init__(self, root: "Root"):
         super().__init__(root)
 
-        self.bg_tex = kn.Texture("assets/background.png")
+        self.bg_tex = self.load_texture("assets/background.png")
+        self.bg_rect = self.bg_tex.get_rect()
 
         self.title_txt = kn.Text(root.font_rune)
         self.title_txt.text = "Mythic Alchemy"
@@ -30,13 +33,9 @@ class MenuState(BaseState):
         self.subtitle_rect = self.subtitle_txt.get_rect()
         self.subtitle_rect.center = kn.renderer.get_res() / 2 + SUBTITLE_OFFSET
 
-        start_txt = kn.Text(root.font)
-        start_txt.text = "Begin the Duel"
-        self.start_btn = Button(start_txt)
+        self.start_btn = Button(root.font, "Begin the Duel", self.hit_index)
 
-        quit_txt = kn.Text(root.font)
-        quit_txt.text = "Quit"
-        self.quit_btn = Button(quit_txt)
+        self.quit_btn = Button(root.font, "Quit", self.hit_index)
 
         self.footer_txt = kn.Text(root.font_sm)
         self.footer_txt.text = "Left click & drag cards to fuse"
@@ -48,20 +47,23 @@ class MenuState(BaseState):
         pass
 
     @override
-    def update(self) -> None:
+    def hover_changed(self) -> bool:
+        return self.start_btn.hover_changed() or self.quit_btn.hover_changed()
+
+    @override
+    def update(self, alpha: float) -> None:
         if self.start_btn.is_clicked():
-            # Rebuild battle state to ensure fresh decks/health/UI each run
-            self.root.states[StateEnum.BATTLE] = self.root._make_battle_state()
-            self.root.current_state = StateEnum.BATTLE
+            self.root.start_battle()
         if self.quit_btn.is_clicked():
             kn.window.close()
 
         # Background
-        kn.renderer.draw(self.bg_tex, anchor=kn.Anchor.TOP_LEFT)
+        queue = get_render_queue()
+        queue.texture(self.bg_tex, self.bg_rect, LAYER_BACKGROUND)
 
         # Title & subtitle
-        self.title_txt.draw(self.title_rect.center, kn.Anchor.CENTER)
-        self.subtitle_txt.draw(self.subtitle_rect.center, kn.Anchor.CENTER)
+        queue.text(self.title_txt, self.title_rect.center, LAYER_HUD_TEXT, kn.Anchor.CENTER)
+        queue.text(self.subtitle_txt, self.subtitle_rect.center, LAYER_HUD_TEXT, kn.Anchor.CENTER)
 
         # Start button
         self.start_btn.draw(kn.renderer.get_res() / 2 + START_OFFSET, kn.Anchor.CENTER)
@@ -70,4 +72,4 @@ class MenuState(BaseState):
         self.quit_btn.draw(kn.renderer.get_res() / 2 + QUIT_OFFSET, kn.Anchor.CENTER)
 
         # Footer hint
-        self.footer_txt.draw(self.footer_rect.bottom_mid, kn.Anchor.BOTTOM_MID)
+        queue.text(self.footer_txt, self.footer_rect.bottom_mid, LAYER_HUD_TEXT, kn.Anchor.BOTTOM_MID)
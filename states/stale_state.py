@@ -1,5 +1,6 @@
 import pykraken as kn
 from states.base_state import BaseState
+from core.render_queue import get_render_queue, LAYER_BACKGROUND, LAYER_HUD_TEXT
 from core.enums import StateEnum
 from core.button import Button
 from core.constants import SCN_SIZE
@@ -14,37 +15,39 @@ BTN_GAP = 240
 
 
 class StaleState(BaseState):
+    static = True
+
     def __init__(self, root: "Root"):
         super().__init__(root)
-        self.bg_tex = kn.Texture("assets/background.png")
+        self.bg_tex = self.load_texture("assets/background.png")
+        self.bg_rect = self.bg_tex.get_rect()
 
         self.title_txt = kn.Text(root.font_lg)
         self.title_txt.text = "Stalemate"
         self.title_rect = self.title_txt.get_rect()
         self.title_rect.center = SCN_SIZE / 2 + TITLE_OFFSET
 
-        retry_txt = kn.Text(root.font)
-        retry_txt.text = "Retry"
-        self.retry_btn = Button(retry_txt)
+        self.retry_btn = Button(root.font, "Retry", self.hit_index)
 
-        menu_txt = kn.Text(root.font)
-        menu_txt.text = "Menu"
-        self.menu_btn = Button(menu_txt)
+        self.menu_btn = Button(root.font, "Menu", self.hit_index)
 
     @override
     def handle_event(self, event: kn.Event) -> None:
         pass
 
+    @override
+    def hover_changed(self) -> bool:
+        return self.retry_btn.hover_changed() or self.menu_btn.hover_changed()
+
     def _draw_buttons(self) -> None:
         center = SCN_SIZE / 2 + BTN_OFFSET
         self.retry_btn.draw(center + kn.Vec2(-BTN_GAP / 2, 0), kn.Anchor.CENTER)
         self.menu_btn.draw(center + kn.Vec2(BTN_GAP / 2, 0), kn.Anchor.CENTER)
 
     @override
-    def update(self) -> None:
+    def update(self, alpha: float) -> None:
         if self.retry_btn.is_clicked():
-            self.root.states[StateEnum.BATTLE] = self.root._make_battle_state()
-            self.root.current_state = StateEnum.BATTLE
+            self.root.start_battle()
             self.root.theme_music.rewind()
             self.root.theme_music.resume()
             return
@@ -55,6 +58,7 @@ class StaleState(BaseState):
             self.root.theme_music.resume()
             return
 
-        kn.renderer.draw(self.bg_tex, anchor=kn.Anchor.TOP_LEFT)
-        self.title_txt.draw(self.title_rect.center, kn.Anchor.CENTER)
+        queue = get_render_queue()
+        queue.texture(self.bg_tex, self.bg_rect, LAYER_BACKGROUND)
+        queue.text(self.title_txt, self.title_rect.center, LAYER_HUD_TEXT, kn.Anchor.CENTER)
         self._draw_buttons()
@@ -0,0 +1,60 @@
+from random import Random
+
+import pytest
+
+from core.atlas import build_atlas, load_atlas_index, pack_rects, read_png, write_png
+
+
+def _overlaps(a, b, padding):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return (ax - padding < bx + bw + padding and bx - padding < ax + aw + padding
+            and ay - padding < by + bh + padding and by - padding < ay + ah + padding)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pack_rects_stays_in_bounds_without_overlap(seed):
+    rng = Random(seed)
+    sizes = [(rng.randint(1, 120), rng.randint(1, 160)) for _ in range(40)]
+    padding = 2
+    width, height, regions = pack_rects(sizes, 256, padding)
+
+    assert width <= 256
+    for (w, h), (x, y, rw, rh) in zip(sizes, regions):
+        assert (rw, rh) == (w, h)
+        assert x - padding >= 0 and y - padding >= 0
+        assert x + w + padding <= width and y + h + padding <= height
+
+    for i, a in enumerate(regions):
+        for b in regions[i + 1:]:
+            assert not _overlaps(a, b, padding)
+
+
+def test_pack_rects_rejects_images_wider_than_the_sheet():
+    with pytest.raises(ValueError):
+        pack_rects([(300, 10)], 256)
+
+
+def test_build_atlas_round_trips_regions_and_pixels(tmp_path):
+    sizes = [(5, 7), (12, 3), (4, 4)]
+    paths = []
+    sources = []
+    for i, (w, h) in enumerate(sizes):
+        pixels = bytes((i * 40 + p) & 0xFF for p in range(w * h * 4))
+        path = str(tmp_path / f"card{i}.png")
+        write_png(path, w, h, pixels)
+        paths.append(path)
+        sources.append(pixels)
+
+    image_out = str(tmp_path / "atlas.png")
+    index_out = str(tmp_path / "atlas.json")
+    index = build_atlas(paths[:-1], paths[-1], image_out, index_out, max_width=32)
+
+    assert load_atlas_index(index_out) == index
+    sheet_w, sheet_h, sheet = read_png(image_out)
+    assert (sheet_w, sheet_h) == index.size
+
+    for (x, y, w, h), pixels in zip(index.cards + [index.shadow], sources):
+        for row in range(h):
+            start = ((y + row) * sheet_w + x) * 4
+            assert sheet[start:start + w * 4] == pixels[row * w * 4:(row + 1) * w * 4]
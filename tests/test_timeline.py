@@ -0,0 +1,42 @@
+from core.timeline import Timeline
+
+
+def test_events_fire_in_time_order_across_tracks():
+    timeline = Timeline()
+    fired = []
+    lhs = timeline.track("lhs")
+    rhs = timeline.track("rhs")
+    lhs.at(0.5, lambda: fired.append("lhs 0.5"))
+    rhs.at(0.2, lambda: fired.append("rhs 0.2"))
+    rhs.at(0.5, lambda: fired.append("rhs 0.5"))
+    lhs.at(0.2, lambda: fired.append("lhs 0.2"))
+    lhs.at(0.9, lambda: fired.append("lhs 0.9"))
+
+    timeline.restart()
+    timeline.update(0.6)
+    assert fired == ["rhs 0.2", "lhs 0.2", "lhs 0.5", "rhs 0.5"]
+
+    timeline.update(1.0)
+    assert fired[-1] == "lhs 0.9"
+    assert timeline.done
+
+
+def test_retimed_tween_keeps_the_track_sorted():
+    class Target:
+        x = 0.0
+        y = 0.0
+
+    target = Target()
+    timeline = Timeline()
+    track = timeline.track("track")
+    late = track.tween(target, "x", 0.0, 1.0, 0.0, 0.2)
+    track.tween(target, "y", 0.0, 1.0, 0.1, 0.1)
+
+    track.retime(late, 0.3)
+    assert [tween.begin for tween in track.tweens] == [0.1, 0.3]
+
+    timeline.restart()
+    timeline.update(0.25)
+    assert target.x == 0.0 and target.y == 1.0
+    timeline.update(0.25)
+    assert target.x == 1.0
@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from core.engine import get_rules, new_match
+from core.enums import MatchOutcome
+
+
+# The two sides do not play the same policy: the rules only let the player play from a hand,
+# and only let the bot fuse straight from its deck
+POLICIES = {
+    "player": "hand autopilot: fuses a pair from hand half the time, otherwise plays a random hand card",
+    "bot": "deck-fusion rule: fuses a random recipe from its deck half the time, otherwise plays its top card",
+}
+
+
+class TournamentStats:
+    def __init__(self):
+        self.matches = 0
+        self.outcomes: Counter[MatchOutcome] = Counter()
+        self.rounds = 0
+        self.card_plays: Counter[int] = Counter()
+        self.card_damage: Counter[int] = Counter()
+        self.card_matches: Counter[int] = Counter()
+        self.card_wins: Counter[int] = Counter()
+        self.card_stales: Counter[int] = Counter()
+        self.card_rounds: Counter[int] = Counter()     # rounds of every match the card was played in
+
+    def merge(self, other: "TournamentStats") -> None:
+        self.matches += other.matches
+        self.rounds += other.rounds
+        for name in ("outcomes", "card_plays", "card_damage", "card_matches", "card_wins", "card_stales",
+                     "card_rounds"):
+            getattr(self, name).update(getattr(other, name))
+
+    def record_match(self, seed: int) -> None:
+        engine = new_match(seed)
+        played = {"player": set(), "bot": set()}
+
+        while engine.outcome is MatchOutcome.ONGOING:
+            engine.begin_round(engine.auto_action())
+            player_card, bot_card = engine.player_card, engine.bot_card
+
+            self._record_play("player", player_card, engine.resolve_player_attack(), played)
+            if bot_card is not None:
+                self._record_play("bot", bot_card, engine.resolve_bot_attack(), played)
+
+            engine.refill()
+            engine.finish_round()
+
+        self.matches += 1
+        self.rounds += engine.rounds
+        self.outcomes[engine.outcome] += 1
+
+        winner = {MatchOutcome.WIN: "player", MatchOutcome.LOSE: "bot"}.get(engine.outcome)
+        for side, card_ids in played.items():
+            self.card_matches.update(card_ids)
+            for card_id in card_ids:
+                self.card_rounds[card_id] += engine.rounds
+            if side == winner:
+                self.card_wins.update(card_ids)
+            elif engine.outcome is MatchOutcome.STALE:
+                self.card_stales.update(card_ids)
+
+    def _record_play(self, side: str, card, damage: int, played: dict[str, set[int]]) -> None:
+        self.card_plays[card.ID] += 1
+        self.card_damage[card.ID] += damage
+        played[side].add(card.ID)
+
+
+def run_block(first_seed: int, count: int) -> TournamentStats:
+    # Each worker keeps its own counters and hands them back once, never per match.
+    stats = TournamentStats()
+    for seed in range(first_seed, first_seed + count):
+        stats.record_match(seed)
+    return stats
+
+
+def run_tournament(matches: int, seed: int = 0, workers: int | None = None) -> TournamentStats:
+    if matches < 1:
+        return TournamentStats()
+
+    workers = workers or os.cpu_count() or 1
+    block = -(-matches // workers)
+    starts = range(seed, seed + matches, block)
+    counts = [min(block, seed + matches - start) for start in starts]
+
+    total = TournamentStats()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stats in pool.map(run_block, starts, counts):
+            total.merge(stats)
+    return total
+
+
+def report(stats: TournamentStats) -> dict:
+    base_cards, fusions = get_rules()
+    recipes = {card.ID: combo for combo, card in fusions.items()}
+
+    def card_row(card_id: int) -> dict:
+        matches = stats.card_matches[card_id]
+        plays = stats.card_plays[card_id]
+        return {
+            "id": card_id,
+            "recipe": list(recipes[card_id]) if card_id in recipes else None,
+            "plays": plays,
+            "damage_per_play": stats.card_damage[card_id] / plays if plays else 0.0,
+            "win_rate": stats.card_wins[card_id] / matches if matches else 0.0,
+            "rounds_to_finish": stats.card_rounds[card_id] / matches if matches else 0.0,
+            "stale_rate": stats.card_stales[card_id] / matches if matches else 0.0,
+        }
+
+    matches = stats.matches or 1
+    return {
+        "matches": stats.matches,
+        "policies": POLICIES,
+        "player_win_rate": stats.outcomes[MatchOutcome.WIN] / matches,
+        "bot_win_rate": stats.outcomes[MatchOutcome.LOSE] / matches,
+        "stale_rate": stats.outcomes[MatchOutcome.STALE] / matches,
+        "mean_rounds": stats.rounds / matches,
+        "cards": [card_row(card.ID) for card in base_cards],
+        "fusions": [card_row(card_id) for card_id in sorted(recipes)],
+    }
+
+
+def print_report(summary: dict, elapsed: float) -> None:
+    print(f"{summary['matches']} autopilot-vs-bot matches in {elapsed:.2f}s ({summary['matches'] / elapsed:.0f}/s)")
+    for side, policy in summary["policies"].items():
+        print(f"  {side}: {policy}")
+    print(
+        f"player win {summary['player_win_rate']:.3f}  bot win {summary['bot_win_rate']:.3f}  "
+        f"stale {summary['stale_rate']:.3f}  rounds {summary['mean_rounds']:.2f}"
+    )
+
+    print(f"\n{'card':>6} {'recipe':>8} {'plays':>10} {'dmg/play':>9} {'win':>7} {'stale':>7} {'rounds':>7}")
+    for row in summary["cards"] + summary["fusions"]:
+        recipe = "+".join(map(str, row["recipe"])) if row["recipe"] else "-"
+        print(
+            f"{row['id']:>6} {recipe:>8} {row['plays']:>10} {row['damage_per_play']:>9.2f} "
+            f"{row['win_rate']:>7.3f} {row['stale_rate']:>7.3f} {row['rounds_to_finish']:>7.2f}"
+        )
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected at least 1, got {number}")
+    return number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(
+        "Run seeded autopilot-vs-bot matches and report per-card statistics. The player side plays the "
+        "hand autopilot and the bot side the deck-fusion rule, so win rates compare the two policies."
+    ))
+    parser.add_argument("-n", "--matches", type=positive_int, default=100_000)
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the first match; match i uses seed + i")
+    parser.add_argument("-j", "--workers", type=positive_int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = run_tournament(args.matches, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+
+    summary = report(stats)
+    print_report(summary, elapsed)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()